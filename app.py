@@ -2,13 +2,83 @@ import os
 import random
 import textwrap
 import math
+import time
+import threading
+import bisect
+import re
+import zlib
+import hashlib
+import json
 import pandas as pd
+import io
+import string
+import html
+import zipfile
 import numpy as np
 import streamlit as st
 from datetime import date, timedelta
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import partial
+from collections import OrderedDict
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import markdown
+except ImportError:
+    markdown = None
+
+from pdf_export import html_to_pdf, pisa
+from question_matching import question_signature
+from translations import TRANSLATIONS
 
 PROJECTS_DIR = "projects"
-os.makedirs(PROJECTS_DIR, exist_ok=True)
+LOCKS_DIR = os.path.join(PROJECTS_DIR, ".locks")
+EXPORTS_DIR = "exports"
+EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+EXPORT_RETENTION_SECONDS = 7 * 24 * 3600
+EXPORT_MAX_FILES = 500
+PROJECT_STORE_DIR = os.path.join(PROJECTS_DIR, ".columnar")
+PROJECT_STORE_LOCK = ".columnar"
+PROJECT_LOCK_STRIPES = 64
+PROJECT_STORE_INITIAL_CAPACITY = 1024
+VENDOR_OPTIONS = ['Plumbing', 'Electrical', 'Tiles', 'Paint', 'Solar', 'Interiors', 'CCTV', 'Automation', 'Landscaping']
+GREEN_OPTIONS = ['Solar Panels', 'Rainwater Harvesting', 'Heat Insulation', 'EV Charging Point', 'Greywater Recycling']
+PROJECT_STORE_CATEGORICAL = ['loc_city', 'intent_type', 'intent_purpose', 'plan_flat_size', 'const_contract', 'qual_connectivity', 'qual_amenities', 'risk_pollution', 'risk_crime']
+PROJECT_STORE_NUMERIC = ['income', 'fin_budget', 'plan_plot_area', 'plan_built_up', 'plan_floors', 'fsi_value', 'const_timeline', 'fin_target_rent', 'fin_target_resale', 'investment_share_p1', 'investment_share_p2']
+PROJECT_STORE_FLAGS = ['fin_loan', 'fin_subsidy', 'extra_floors_rent', 'is_joint_investment']
+PROJECT_STORE_BITSETS = {'const_vendors': VENDOR_OPTIONS, 'const_green': GREEN_OPTIONS}
+REPORT_FONT_FILE = os.path.join("data", "fonts", "report.ttf")
+REPORT_PDF_RESOURCES = (os.path.abspath(REPORT_FONT_FILE),)
+REPORT_WORKERS = 4
+REPORT_POLL_SECONDS = 1.0
+REPORT_JOB_RETENTION_SECONDS = 600
+PROJECT_INDEX_RESCAN_SECONDS = 5.0
+PROJECT_SEARCH_PAGE_SIZE = 20
+PROJECT_INDEX_COLUMNS = ['name', 'intent_type', 'loc_city', 'fin_budget']
+SEMANTIC_CACHE_MAX_CONTEXTS = 64
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+MARKET_LAZY_CITIES_MAX = 256
+MARKET_CATALOG_REFRESH_SECONDS = 6 * 3600
+MARKET_CITIES = ["Nagpur", "Pune", "Mumbai", "Thane", "Nashik", "Aurangabad", "Delhi", "Bengaluru", "Hyderabad", "Chennai", "Kolkata", "Ahmedabad", "Default City"]
+GEO_DATA_DIR = os.path.join("data", "geo")
+GEO_INDEX_CELL_DEG = 0.05
+RISK_LEVELS = ['Low', 'Medium', 'High']
+FLOOD_DEPTH_MEDIUM_M = 0.0
+FLOOD_DEPTH_HIGH_M = 1.0
+VENDORS_FILE = os.path.join("data", "vendors.csv")
+VENDOR_RATING_PRIOR_REVIEWS = 20
+VENDOR_PAGE_SIZE = 5
+VENDOR_TOP_MATCHES = 2
+GEMINI_FALLBACK_RESPONSE = "Sorry, I couldn't process your request. The API may be busy. Please try again."
+os.makedirs(LOCKS_DIR, exist_ok=True)
+os.makedirs(EXPORTS_DIR, exist_ok=True)
 
 try:
     import google.generativeai as genai
@@ -29,89 +99,6 @@ selected_key = random.choice(valid_api_keys)
 genai.configure(api_key=selected_key)
 MODEL = genai.GenerativeModel("gemini-1.5-flash")
 
-TRANSLATIONS = {
-    'en': {
-        "language_name": "English", "app_title": "AI Real Estate Advisor", "project_manager_title": "Project Manager",
-        "active_project_caption": "Active Project", "switch_project_button": "🔄 Switch Project", "danger_zone_header": "🚨 Danger Zone",
-        "delete_confirm_checkbox": "Confirm deletion", "delete_project_button": "❌ Delete Project Permanently", "project_deleted_success": "Project '{project_name}' has been deleted.",
-        "project_file_not_found_warning": "Project file for '{project_name}' not found.", "delete_project_error": "Error deleting project: {e}",
-        "create_new_project_header": "➕ Create New Project", "new_project_name_label": "Enter a Unique Project Name", "start_new_project_button": "Start New Project",
-        "project_name_exists_error": "Project name already exists.", "enter_project_name_warning": "Please enter a project name.",
-        "load_existing_project_header": "📂 Load Existing Project", "select_project_placeholder": "Choose a project...", "load_project_button": "Load Project",
-        "project_loaded_success": "Project '{project_name}' loaded successfully!", "load_project_error": "Failed to load project '{project_name}': {e}",
-        "disclaimer_info": "AI-generated advice. Always consult a professional before making financial decisions.",
-        "welcome_message": "👋 **Welcome!** To begin, please create a new project or load an existing one from the sidebar.", "current_project_header": "Current Project: **{project_name}**",
-        "step1_header": "STEP 1: Your Personal Details", "full_name_label": "Full Name", "dob_label": "Date of Birth", "contact_label": "Email or Phone",
-        "income_label": "Annual Household Income (₹)", "next_goal_button": "Next: Define Your Goal", "fill_all_details_error": "Please fill in all details.",
-        "step2_header": "STEP 2: What is Your Primary Goal?", "select_goal_label": "Select your goal", "buy_flat": "Buy a Flat", "build_house": "Build a House",
-        "buy_plot": "Buy a Plot", "mixed_investment": "Mixed / Investment", "next_specifics_button": "Next: Add Specifics",
-        "step3_header": "STEP 3: Specifics for '{intent_type}'", "location_budget_header": "Location & Budget", "target_city_label": "Target City",
-        "localities_label": "Preferred Localities (comma-separated)", "pincode_label": "Pin Code", "budget_label": "Total Budget (₹)",
-        "need_loan_checkbox": "Need a loan?", "subsidy_checkbox": "Interested in subsidy schemes?", "main_purpose_label": "Main purpose?",
-        "self_use": "Self Use", "rental_income": "Rental Income", "resale_investment": "Resale / Investment", "mixed_components_label": "Select all that apply:",
-        "flat_details_header": "Flat Details", "flat_size_label": "Flat Size", "plot_construction_potential_header": "Plot & Construction Potential",
-        "plot_area_label": "Plot Area (sq. ft)", "construction_details_header": "Construction Details", "built_up_area_label": "Target Built-up Area (sq. ft)",
-        "floors_label": "Number of Floors Planned", "extra_floors_rent_checkbox": "Plan extra floors for rent?", "contract_type_label": "Contract Type",
-        "vendors_label": "Specific Vendors Needed?", "green_features_label": "Desired Green Features", "timeline_label": "Estimated Build Timeline (Months)",
-        "preferences_concerns_header": "Preferences & Concerns", "connectivity_label": "Connectivity Importance", "amenities_label": "Proximity to Schools/Hospitals",
-        "pollution_label": "Pollution Concern Level", "crime_label": "Crime Concern Level", "investment_goals_header": "Investment Goals",
-        "target_rent_label": "Target Monthly Rent Income (₹)", "target_resale_label": "Target Resale Price (₹)", "save_proceed_button": "Save Project & Proceed to Analysis",
-        "step4_header": "STEP 4: Review and Generate AI Strategy", "project_saved_success": "Your project is saved. Review the details below and generate your personalized financial plan.",
-        "view_details_expander": "View/Hide Your Saved Project Details", "market_snapshot_header": "📈 Market Snapshot: {city}", "generate_strategy_button": "🧠 Generate Financial Strategy",
-        "edit_details_button": "✏️ Edit Specifics", "analyzing_spinner": "🤖 Analyzing your project and crafting a detailed financial plan...",
-        "strategy_header": "💡 Your Personalized Financial Strategy", "follow_up_expander": "💬 Ask a Follow-up Question",
-        "follow_up_placeholder": "e.g., What happens if the interest rate increases by 0.5%?", "ask_advisor_button": "✉️ Ask Advisor",
-        "enter_question_warning": "Please enter a question.", "thinking_spinner": "🤔 Thinking...", "mixed_investment_header": "Co-Ownership & Investment Details",
-        "is_joint_investment_checkbox": "Is this a joint investment with a co-owner?", "co_owner_name_label": "Co-owner's Full Name",
-        "co_owner_relationship_label": "Relationship to Co-owner", "investment_share_p1_label": "Your Share (%)", "investment_share_p2_label": "Co-owner's Share (%)",
-        "relationship_spouse": "Spouse", "relationship_parent": "Parent/Child", "relationship_sibling": "Sibling", "relationship_business": "Business Partner", "relationship_other": "Other",
-        "fsi_label": "Floor Space Index (FSI)", "fsi_help": "The ratio of a building's total floor area to the size of the piece of land upon which it is built. Check local regulations for the correct value.",
-        "max_construction_area_label": "Max. Permissible Construction Area", "print_report_button": "🖨️ Print Report",
-        "advanced_tools_header": "🛠️ Advanced Analysis Tools", "back_to_analysis_button": "⬅️ Back to Main Analysis", "back_button_text": "⬅️ Back",
-        "api_error_message": "⚠️ An error occurred with the AI service: {err}",
-        "analysis_projections_header": "Analysis & Projections", "cost_construction_header": "Cost & Construction", "financial_green_header": "Financial & Green",
-        "tool_build_vs_buy_button": "Build vs. Buy", "tool_build_vs_buy_title": "Build vs. Buy: Unit Economics", "tool_build_vs_buy_info": "This tool compares the total project cost of building a multi-unit property versus the cost of buying a single ready-made flat, breaking it down to a per-unit cost.", "build_cost_header": "Total Project Cost (to Build)", "buy_cost_header": "Cost to Buy (Single Flat)", "land_cost": "Land Cost", "construction_cost": "Total Construction Cost", "other_costs": "Other Costs (10%)", "total_build_cost": "Total Project Cost", "property_price": "Ready-Made Flat Price", "breakeven_analysis_header": "Per-Unit Breakeven Analysis", "num_flats_to_build_label": "Number of Flats to Build", "cost_per_flat_build_label": "Cost Per Flat (If You Build)", "price_ready_flat_label": "Price of Ready-Made Flat", "build_vs_buy_conclusion": "Your total project cost of **₹{total_build_cost:,.0f}** is high due to land value. However, by building **{num_flats} units**, your effective cost per flat is **₹{cost_per_flat:,.0f}**, which is **{comparison}** than buying a single ready-made flat for **₹{buy_price:,.0f}**.",
-        "tool_locality_compare_button": "Hyper-Local Prices", "tool_locality_compare_title": "Hyper-Local Price Analyzer", "tool_locality_compare_info": "This tool shows how property prices can vary within the same locality based on proximity to the main road.", "locality_price_table_header": "Price Variation in {locality}",
-        "tool_sqft_breakdown_button": "Detailed Costs", "tool_sqft_breakdown_title": "Detailed Construction Cost Breakdown", "tool_sqft_breakdown_info": "This provides a detailed breakdown of construction costs, showing each item's price based on your budget and its percentage of the total.", "house_construction_tab": "House Construction Costs", "flat_interiors_tab": "Flat Finishing Costs", "cost_item_label": "Item", "cost_sqft_label": "Cost per sq.ft. (₹)", "cost_as_percent_label": "% of Total", "cost_price_label": "Price (₹)",
-        "tool_contract_diff_button": "Material Prices", "tool_contract_diff_title": "Material Price Analyzer", "tool_contract_diff_info": "This tool shows estimated prices for key construction materials across different commercial zones in your city.", "material_prices_header": "Estimated Material Prices in {city}",
-        "tool_resale_predictor_button": "Resale Predictor", "tool_resale_predictor_title": "Resale Value Predictor", "tool_resale_predictor_info": "This tool projects the future resale value of your property based on a simulated annual growth rate.", "resale_projection_header": "{years}-Year Resale Projection for a {size} sq.ft. Property", "current_value_label": "Current Estimated Value", "projected_value_label": "Projected Value", "annual_growth_rate_label": "Simulated Annual Growth Rate", "property_size_label": "Property Size (sq.ft)",
-        "tool_rent_forecaster_button": "Rent Forecaster", "tool_rent_forecaster_title": "Hyper-Local Rental Income Forecaster", "tool_rent_forecaster_info": "Estimate potential monthly rent based on both rental type (Residential, Retail, Office) and the property's specific location within the neighborhood.", "forecast_monthly_rent_label": "Forecasted Monthly Rent (₹)", "location_label": "Location",
-        "tool_payback_calculator_button": "Payback Calculator", "tool_payback_calculator_title": "Hyper-Local Investment Payback Calculator", "tool_payback_calculator_info": "Calculates the payback period (in years) based on rental type and location, factoring in different maintenance & expense ratios for each.", "payback_period_label": "Payback Period (Years)",
-        "rent_type_residential": "Residential", "rent_type_commercial_retail": "Commercial (Retail)", "rent_type_commercial_office": "Commercial (Office)",
-        "green_eco_costing_header": "♻️ Green + Eco Costing",
-        "tool_green_cost_estimator_button": "Green Cost Estimator", "tool_green_cost_estimator_title": "Green Feature Cost Estimator", "tool_green_cost_estimator_info": "Estimate the initial installation cost for popular eco-friendly features like solar panels, rainwater harvesting, and insulation.",
-        "green_feature_label": "Green Feature", "estimated_cost_label": "Estimated Cost (₹)", "notes_label": "Notes / Assumptions",
-        "solar_panels_label": "Solar Panels", "rainwater_harvesting_label": "Rainwater Harvesting", "heat_insulation_label": "Heat Insulation (Roof)",
-        "solar_note": "Based on a 5kW system for a standard house.", "rainwater_note": "For a 10,000-liter underground tank.", "insulation_note": "Based on roof area (approx. 60% of built-up area).",
-        "tool_green_savings_predictor_button": "Green Savings Predictor", "tool_green_savings_predictor_title": "Eco-Savings & Payback Predictor", "tool_green_savings_predictor_info": "This tool forecasts your long-term financial savings on utility bills (electricity, water) from green investments and calculates the simple payback period.",
-        "annual_savings_label": "Est. Annual Savings (₹)", "payback_period_years_label": "Payback Period (Years)",
-        "location_intelligence_header": "📍 Location & Market Intelligence",
-        "tool_location_quality_button": "Location Quality Score", "tool_location_quality_title": "Location Quality Score Analyzer", "tool_location_quality_info": "Calculates a quality score for your target location based on your preferences for connectivity, amenities, and your concerns about pollution and crime.",
-        "your_location_score_label": "Your Location's Quality Score", "score_breakdown_header": "Score Breakdown", "factor_label": "Factor", "your_preference_label": "Your Preference", "score_impact_label": "Score Impact",
-        "tool_compare_localities_button": "Compare Nearby Options", "tool_compare_localities_title": "Comparative Locality Analysis", "tool_compare_localities_info": "Discover alternative localities in the same city that might offer better value or a better location score for your budget.",
-        "your_target_locality_label": "Your Target Locality", "for_your_budget_label": "For your budget of", "you_can_get_label": "you can get approx.", "sq_ft_label": "sq. ft.",
-        "alternative_localities_header": "Alternative Localities in {city}", "locality_label": "Locality", "avg_price_psf_label": "Avg. Price (psf)", "location_score_label": "Location Score", "property_size_for_budget_label": "Area for your Budget", "vibe_label": "Vibe / Character",
-        "tool_env_risk_button": "Environmental Risk", "tool_env_risk_title": "Flood & Eco-Zone Risk Analysis", "tool_env_risk_info": "Assesses potential flood and ecological sensitivity risks for your chosen locality. *Note: This is a simulation based on general data and not a legal certification.*",
-        "risk_assessment_for_label": "Risk Assessment For:", "flood_risk_label": "Flood Zone Risk", "eco_risk_label": "Ecological Sensitivity",
-        "risk_level_low": "Low", "risk_level_medium": "Medium", "risk_level_high": "High",
-        "risk_advice_low": "Standard precautions recommended.", "risk_advice_medium": "Further due diligence recommended. Check local municipal records and consider professional assessment.", "risk_advice_high": "High risk indicated. Essential to consult local authorities and perform a detailed environmental impact assessment before proceeding.",
-        "tool_vendor_suggestion_button": "Find Vendors", "tool_vendor_suggestion_title": "Top-Rated Vendor Suggestions", "tool_vendor_suggestion_info": "Find simulated top-rated builders and vendors in your city for various project needs. *Ratings and reviews are for demonstration purposes.*",
-        "vendor_type_label": "Select Vendor Type", "vendor_name_label": "Vendor Name", "vendor_specialty_label": "Specialty", "vendor_rating_label": "Rating", "vendor_review_label": "Summary",
-        "tool_loan_guide_button": "Loan & Subsidy Guide", "tool_loan_guide_title": "Loan & Subsidy Eligibility Guide", "tool_loan_guide_info": "Get information on home loans, potential government subsidies like PMAY, and tax benefits.",
-        "loan_tips_header": "Home Loan Tips", "pmay_guide_header": "PMAY Subsidy Guide", "tax_benefits_header": "Tax Saving Tips", "pmay_eligibility_header": "Your PMAY Eligibility (Simulation)",
-    },
-    'hi': {
-        "language_name": "Hindi (हिन्दी)", "app_title": "एआई रियल एस्टेट सलाहकार",
-    },
-    'mr': {
-        "language_name": "Marathi (मराठी)", "app_title": "एआय रिअल इस्टेट सल्लागार",
-    }
-}
-for lang in ['hi', 'mr']:
-    for key, value in TRANSLATIONS['en'].items():
-        if key not in TRANSLATIONS[lang]:
-            TRANSLATIONS[lang][key] = value
-
 def t(key):
     return TRANSLATIONS[st.session_state.language].get(key, key)
 
@@ -122,9 +109,25 @@ CSV_COLUMNS = [
     'const_timeline','qual_connectivity','qual_amenities','risk_pollution','risk_crime',
     'fin_target_rent','fin_target_resale',
     'is_joint_investment', 'co_owner_name', 'co_owner_relationship', 'investment_share_p1', 'investment_share_p2',
-    'fsi_value'
+    'fsi_value', 'project_version'
 ]
 
+REPORT_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="$lang"><head><meta charset="utf-8"><title>$title</title>
+<style>
+$font_css
+@page { size: A4; margin: 1.6cm; }
+body { font-size: 10pt; color: #222; }
+h1 { font-size: 18pt; margin-bottom: 2pt; } h2 { font-size: 13pt; margin-top: 14pt; border-bottom: 1px solid #999; } h3 { font-size: 11pt; }
+table { width: 100%; border-collapse: collapse; margin: 6pt 0; } th, td { border: 1px solid #bbb; padding: 3pt 5pt; text-align: left; } th { background: #eee; }
+</style></head>
+<body><h1>$title</h1><p><strong>$project_name</strong></p>
+$report_html
+<h2>$tables_header</h2>
+$tables_html
+</body></html>
+"""
+
 @st.cache_data(ttl=600)
 def ask_gemini(prompt: str, temperature: float = 0.4) -> str:
     try:
@@ -132,14 +135,304 @@ def ask_gemini(prompt: str, temperature: float = 0.4) -> str:
         return response.text
     except Exception as err:
         st.error(t('api_error_message').format(err=err), icon="🤖")
-        return "Sorry, I couldn't process your request. The API may be busy. Please try again."
-
-def get_saved_projects():
-    return sorted([f.replace(".csv", "").replace("_", " ") for f in os.listdir(PROJECTS_DIR) if f.endswith(".csv")])
+        return GEMINI_FALLBACK_RESPONSE
+
+def semantic_cache_context_key(initial_report, lang_code):
+    return hashlib.sha256(f"{lang_code}\n{initial_report}".encode("utf-8")).hexdigest()
+
+@st.cache_resource
+def get_semantic_cache():
+    return {"contexts": OrderedDict(), "hits": 0, "lookups": 0, "lock": threading.Lock()}
+
+def semantic_cache_lookup(context_key, question):
+    cache = get_semantic_cache(); signature = question_signature(question)
+    with cache["lock"]:
+        cache["lookups"] += 1
+        context = cache["contexts"].get(context_key)
+        if context is None or signature not in context: return None
+        cache["contexts"].move_to_end(context_key); context.move_to_end(signature)
+        cache["hits"] += 1
+        return context[signature]
+
+def semantic_cache_store(context_key, question, answer):
+    cache = get_semantic_cache(); signature = question_signature(question)
+    with cache["lock"]:
+        context = cache["contexts"].setdefault(context_key, OrderedDict())
+        cache["contexts"].move_to_end(context_key)
+        if len(cache["contexts"]) > SEMANTIC_CACHE_MAX_CONTEXTS: cache["contexts"].popitem(last=False)
+        context[signature] = answer; context.move_to_end(signature)
+        if len(context) > SEMANTIC_CACHE_MAX_ENTRIES: context.popitem(last=False)
+
+def get_semantic_cache_stats():
+    cache = get_semantic_cache()
+    with cache["lock"]: hits, lookups = cache["hits"], cache["lookups"]
+    return {"hits": hits, "lookups": lookups, "rate": hits / lookups if lookups else 0.0}
+
+def project_exists(project_name):
+    return os.path.exists(get_project_filepath(project_name))
+
+@st.cache_resource
+def get_project_index_store():
+    return {"entries": {}, "sorted_keys": [], "scanned_at": 0.0, "lock": threading.Lock()}
+
+def read_project_index_entry(filepath, mtime):
+    df = pd.read_csv(filepath, usecols=lambda c: c in PROJECT_INDEX_COLUMNS, nrows=1).fillna('')
+    row = df.to_dict('records')[0] if not df.empty else {}
+    try: budget = float(row.get('fin_budget') or 0)
+    except (ValueError, TypeError): budget = 0.0
+    return {"owner": str(row.get('name', '')).lower(), "intent_type": row.get('intent_type', ''), "loc_city": normalize_city(row.get('loc_city')).lower(), "fin_budget": budget, "mtime": mtime}
+
+def _index_put(store, project_name, entry):
+    if project_name not in store["entries"]: bisect.insort(store["sorted_keys"], (project_name.lower(), project_name))
+    store["entries"][project_name] = entry
+
+def _index_remove(store, project_name):
+    if store["entries"].pop(project_name, None) is None: return
+    i = bisect.bisect_left(store["sorted_keys"], (project_name.lower(), project_name))
+    if i < len(store["sorted_keys"]) and store["sorted_keys"][i][1] == project_name: del store["sorted_keys"][i]
+
+def get_project_index(force_rescan=False):
+    store = get_project_index_store()
+    with store["lock"]:
+        if not force_rescan and time.time() - store["scanned_at"] < PROJECT_INDEX_RESCAN_SECONDS: return store
+        seen = set()
+        for entry in os.scandir(PROJECTS_DIR):
+            if not entry.name.endswith(".csv"): continue
+            project_name = entry.name[:-4].replace("_", " "); mtime = entry.stat().st_mtime; seen.add(project_name)
+            current = store["entries"].get(project_name)
+            if current is not None and current["mtime"] == mtime: continue
+            try: _index_put(store, project_name, read_project_index_entry(entry.path, mtime))
+            except Exception: continue
+        for project_name in [name for name in store["entries"] if name not in seen]: _index_remove(store, project_name)
+        store["scanned_at"] = time.time()
+        return store
+
+def update_project_index(project_name):
+    store = get_project_index_store(); filepath = get_project_filepath(project_name)
+    with store["lock"]:
+        if os.path.exists(filepath): _index_put(store, project_name, read_project_index_entry(filepath, os.path.getmtime(filepath)))
+        else: _index_remove(store, project_name)
+
+def _project_store_columns():
+    return {"alive": np.bool_, "mtime": np.float64, **{c: np.int32 for c in PROJECT_STORE_CATEGORICAL}, **{c: np.float32 for c in PROJECT_STORE_NUMERIC},
+            **{c: np.bool_ for c in PROJECT_STORE_FLAGS}, **{c: np.uint16 for c in PROJECT_STORE_BITSETS}}
+
+def _project_store_path(name):
+    return os.path.join(PROJECT_STORE_DIR, name)
+
+def _rewrite_project_store_column(path, dtype, capacity, values):
+    tmp_path = f"{path}.tmp"
+    rewritten = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=(capacity,))
+    rewritten[:len(values)] = values; rewritten.flush(); del rewritten
+    os.replace(tmp_path, path)
+
+def _read_project_store_meta():
+    with open(_project_store_path("meta.json"), encoding="utf-8") as f: meta = json.load(f)
+    return {"capacity": meta["capacity"], "generation": meta.get("generation", 0)}
+
+def _write_project_store_meta(store):
+    write_file_atomic(_project_store_path("meta.json"), json.dumps({"capacity": store["capacity"], "generation": store["generation"]}))
+
+def _open_project_store_columns(store):
+    if not os.path.exists(_project_store_path("meta.json")): _write_project_store_meta({"capacity": PROJECT_STORE_INITIAL_CAPACITY, "generation": 0})
+    meta = _read_project_store_meta(); store["capacity"], store["generation"] = meta["capacity"], meta["generation"]
+    for column, dtype in _project_store_columns().items():
+        path = _project_store_path(f"{column}.npy")
+        if not os.path.exists(path): np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(store["capacity"],)).flush()
+        values = np.load(path, mmap_mode="r+")
+        if values.dtype != dtype: _rewrite_project_store_column(path, dtype, store["capacity"], values); values = np.load(path, mmap_mode="r+")
+        store["columns"][column] = values
+
+def _grow_project_store(store, min_rows):
+    capacity = max(store["capacity"] * 2, min_rows)
+    for column, dtype in _project_store_columns().items():
+        _rewrite_project_store_column(_project_store_path(f"{column}.npy"), dtype, capacity, store["columns"][column])
+    store["capacity"] = capacity; _write_project_store_meta(store)
+    _open_project_store_columns(store)
+
+def _sync_project_store(store):
+    meta = _read_project_store_meta()
+    if meta["capacity"] != store["capacity"]: _open_project_store_columns(store)
+    store["generation"] = meta["generation"]
+    vocab_path = _project_store_path("vocab.json")
+    if os.path.exists(vocab_path):
+        with open(vocab_path, encoding="utf-8") as f:
+            header = re.match(r'\{"version": (\d+)', f.read(32))
+            if header is None or int(header.group(1)) != store["vocab_version"]:
+                f.seek(0); vocab = json.load(f)
+                store["vocab"], store["vocab_version"] = (vocab["columns"], vocab["version"]) if "version" in vocab else (vocab, 0)
+                store["codes"] = {column: {value: code for code, value in enumerate(values)} for column, values in store["vocab"].items()}
+    with open(_project_store_path("names.txt"), "rb") as f:
+        f.seek(store["names_offset"]); tail = f.read()
+    for project_name in tail.decode("utf-8").splitlines():
+        store["rows"][project_name] = len(store["names"]); store["names"].append(project_name)
+    store["names_offset"] += len(tail)
+
+def _encode_category(store, column, value):
+    value = normalize_city(value) if column == 'loc_city' else str(value or '')
+    if not value: return -1
+    codes = store["codes"].setdefault(column, {})
+    if value not in codes:
+        codes[value] = len(codes); store["vocab"].setdefault(column, []).append(value)
+        store["vocab_version"] = (store["vocab_version"] or 0) + 1
+        write_file_atomic(_project_store_path("vocab.json"), json.dumps({"version": store["vocab_version"], "columns": store["vocab"]}))
+    return codes[value]
+
+def _encode_bitset(values, options):
+    if isinstance(values, str): values = values.split('|') if values else []
+    return sum(1 << options.index(v) for v in set(values or []) if v in options)
+
+def _project_store_upsert(store, project_name, details, mtime):
+    row = store["rows"].get(project_name)
+    if row is None:
+        row = len(store["names"])
+        if row >= store["capacity"]: _grow_project_store(store, row + 1)
+        with open(_project_store_path("names.txt"), "ab") as f: encoded = f"{project_name}\n".encode("utf-8"); f.write(encoded)
+        store["rows"][project_name] = row; store["names"].append(project_name); store["names_offset"] += len(encoded)
+    columns = store["columns"]
+    for column in PROJECT_STORE_CATEGORICAL: columns[column][row] = _encode_category(store, column, details.get(column))
+    for column in PROJECT_STORE_NUMERIC:
+        try: columns[column][row] = float(details.get(column) or 0)
+        except (ValueError, TypeError): columns[column][row] = 0.0
+    for column in PROJECT_STORE_FLAGS: columns[column][row] = str(details.get(column)).lower() in ('true', '1', '1.0')
+    for column, options in PROJECT_STORE_BITSETS.items(): columns[column][row] = _encode_bitset(details.get(column), options)
+    columns["alive"][row], columns["mtime"][row] = True, mtime
+
+def _reconcile_project_store(store):
+    seen, changed = set(), False
+    columns = store["columns"]
+    for entry in os.scandir(PROJECTS_DIR):
+        if not entry.name.endswith(".csv"): continue
+        project_name = entry.name[:-4].replace("_", " "); mtime = entry.stat().st_mtime; seen.add(project_name)
+        row = store["rows"].get(project_name)
+        if row is not None and columns["alive"][row] and columns["mtime"][row] == mtime: continue
+        try: _project_store_upsert(store, project_name, read_project_details(project_name), mtime); changed = True
+        except Exception: continue
+    for project_name, row in store["rows"].items():
+        if columns["alive"][row] and project_name not in seen: columns["alive"][row] = False; changed = True
+    if changed: store["generation"] += 1; _write_project_store_meta(store)
+    store["reconciled_at"] = time.time()
+
+@st.cache_resource
+def get_project_store():
+    os.makedirs(PROJECT_STORE_DIR, exist_ok=True)
+    store = {"columns": {}, "capacity": 0, "generation": 0, "names": [], "rows": {}, "names_offset": 0, "vocab": {}, "codes": {}, "vocab_version": None, "reconciled_at": 0.0}
+    with project_lock(PROJECT_STORE_LOCK):
+        _open_project_store_columns(store)
+        if not os.path.exists(_project_store_path("names.txt")): open(_project_store_path("names.txt"), "wb").close()
+        _sync_project_store(store); _reconcile_project_store(store)
+    return store
+
+def update_project_store(project_name, details=None):
+    filepath = get_project_filepath(project_name)
+    with project_lock(PROJECT_STORE_LOCK):
+        store = get_project_store(); _sync_project_store(store)
+        if details is not None: _project_store_upsert(store, project_name, details, os.path.getmtime(filepath))
+        elif project_name in store["rows"]: store["columns"]["alive"][store["rows"][project_name]] = False
+        store["generation"] += 1; _write_project_store_meta(store)
+
+def _project_store_snapshot():
+    with project_lock(PROJECT_STORE_LOCK):
+        store = get_project_store(); _sync_project_store(store)
+        if time.time() - store["reconciled_at"] >= PROJECT_INDEX_RESCAN_SECONDS: _reconcile_project_store(store)
+        return store, len(store["names"])
+
+def filter_project_store(city=None, intent_type=None, budget_min=None, budget_max=None, vendors=(), green=()):
+    store, n = _project_store_snapshot(); columns, codes = store["columns"], store["codes"]
+    mask = np.array(columns["alive"][:n])
+    if city: mask &= columns["loc_city"][:n] == codes.get("loc_city", {}).get(normalize_city(city), -2)
+    if intent_type: mask &= columns["intent_type"][:n] == codes.get("intent_type", {}).get(intent_type, -2)
+    if budget_min: mask &= columns["fin_budget"][:n] >= budget_min
+    if budget_max: mask &= columns["fin_budget"][:n] <= budget_max
+    for column, selected in (("const_vendors", vendors), ("const_green", green)):
+        bits = _encode_bitset(selected, PROJECT_STORE_BITSETS[column])
+        if bits: mask &= (columns[column][:n] & bits) == bits
+    return mask
+
+def summarize_project_store(mask=None):
+    store, n = _project_store_snapshot(); columns = store["columns"]
+    if mask is None: mask = np.array(columns["alive"][:n])
+    budgets, city_codes = columns["fin_budget"][:n][mask], columns["loc_city"][:n][mask]
+    cities = store["vocab"].get("loc_city", []); known = city_codes >= 0
+    counts = np.bincount(city_codes[known], minlength=len(cities)); budget_sums = np.bincount(city_codes[known], weights=budgets[known], minlength=len(cities))
+    by_city = pd.DataFrame({'loc_city': cities, 'count': counts, 'mean_budget': budget_sums / np.maximum(counts, 1)})
+    by_city = by_city[by_city['count'] > 0].sort_values('count', ascending=False)
+    count = int(mask.sum()); total_budget = float(budgets.sum(dtype=np.float64))
+    return {"count": count, "total_budget": total_budget, "mean_budget": total_budget / count if count else 0.0, "by_city": by_city}
+
+def project_store_generation():
+    store = get_project_store()
+    if time.time() - store["reconciled_at"] >= PROJECT_INDEX_RESCAN_SECONDS: _project_store_snapshot()
+    return _read_project_store_meta()["generation"]
+
+def filter_project_names(mask):
+    store, n = _project_store_snapshot()
+    return {store["names"][row] for row in np.flatnonzero(mask[:n])}
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_portfolio_summary(generation, city, intent_type, budget_min, budget_max, vendors, green):
+    return summarize_project_store(filter_project_store(city, intent_type, budget_min, budget_max, vendors, green))
+
+def search_projects(prefix="", city="", intent_type=None, budget_min=0.0, budget_max=0.0, owner=""):
+    store = get_project_index(); prefix, city, owner = prefix.strip().lower(), normalize_city(city).lower() if city.strip() else "", owner.strip().lower()
+    with store["lock"]:
+        keys = store["sorted_keys"]; start = bisect.bisect_left(keys, (prefix, ""))
+        matches = []
+        for key, project_name in keys[start:]:
+            if not key.startswith(prefix): break
+            entry = store["entries"][project_name]
+            if city and entry["loc_city"] != city: continue
+            if intent_type and entry["intent_type"] != intent_type: continue
+            if budget_min and entry["fin_budget"] < budget_min: continue
+            if budget_max and entry["fin_budget"] > budget_max: continue
+            if owner and owner not in entry["owner"]: continue
+            matches.append(project_name)
+    return matches
 
 def get_project_filepath(project_name):
     return os.path.join(PROJECTS_DIR, f"{project_name.replace(' ', '_')}.csv")
 
+@st.cache_resource
+def get_project_lock_manager():
+    stripes = {f"stripe-{index:02d}" for index in range(PROJECT_LOCK_STRIPES)}
+    for entry in os.scandir(LOCKS_DIR):
+        if entry.name.endswith(".lock") and not entry.name.startswith(".") and entry.name[:-5] not in stripes: os.remove(entry.path)
+    return {"locks": {}, "lock": threading.Lock()}
+
+def project_lock_key(project_name):
+    if project_name.startswith("."): return project_name
+    return f"stripe-{zlib.crc32(project_name.encode('utf-8')) % PROJECT_LOCK_STRIPES:02d}"
+
+@contextmanager
+def project_lock(project_name):
+    manager = get_project_lock_manager(); lock_key = project_lock_key(project_name)
+    with manager["lock"]: entry = manager["locks"].setdefault(lock_key, {"lock": threading.RLock(), "depth": 0})
+    with entry["lock"]:
+        if fcntl is None or entry["depth"] > 0:
+            entry["depth"] += 1
+            try: yield
+            finally: entry["depth"] -= 1
+        else:
+            with open(os.path.join(LOCKS_DIR, f"{lock_key}.lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX); entry["depth"] += 1
+                try: yield
+                finally: entry["depth"] -= 1; fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def write_file_atomic(filepath, content):
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(content if isinstance(content, bytes) else content.encode("utf-8")); f.flush(); os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+
+def read_project_version(filepath):
+    if not os.path.exists(filepath): return 0
+    df = pd.read_csv(filepath, usecols=lambda c: c == 'project_version')
+    if df.empty or 'project_version' not in df.columns or pd.isna(df['project_version'].iloc[0]): return 0
+    return int(df['project_version'].iloc[0])
+
 def save_project():
     project_name = st.session_state.selected_project
     if not project_name: return False
@@ -149,30 +442,46 @@ def save_project():
             data_to_save[key] = '|'.join(map(str, data_to_save[key]))
     if 'dob' in data_to_save and isinstance(data_to_save.get('dob'), date):
         data_to_save['dob'] = data_to_save['dob'].isoformat()
+    filepath = get_project_filepath(project_name); expected_version = int(st.session_state.get('project_version') or 0)
     try:
-        df = pd.DataFrame([data_to_save])[CSV_COLUMNS]
-        df.to_csv(get_project_filepath(project_name), index=False)
+        with project_lock(project_name):
+            current_version = read_project_version(filepath)
+            if current_version != expected_version:
+                st.error(t('project_version_conflict_error').format(project_name=project_name, current_version=current_version, expected_version=expected_version))
+                return False
+            data_to_save['project_version'] = expected_version + 1
+            df = pd.DataFrame([data_to_save])[CSV_COLUMNS]
+            write_file_atomic(filepath, df.to_csv(index=False))
+            st.session_state.project_version = expected_version + 1
+            refresh_project_views(project_name, data_to_save)
         return True
     except Exception as e:
         st.error(f"Error saving project '{project_name}': {e}")
         return False
 
+def refresh_project_views(project_name, details=None):
+    for refresh in (lambda: update_project_index(project_name), lambda: update_project_store(project_name, details)):
+        try: refresh()
+        except Exception as err: st.warning(t('project_views_refresh_warning').format(project_name=project_name, err=err))
+
+def read_project_details(project_name):
+    details = pd.read_csv(get_project_filepath(project_name)).fillna('').to_dict('records')[0]
+    for key in ['mixed_components', 'const_vendors', 'const_green']:
+        details[key] = details[key].split('|') if isinstance(details.get(key), str) and details[key] else []
+    details['project_version'] = int(details.get('project_version') or 0)
+    details['dob'] = date.fromisoformat(str(details['dob'])) if details.get('dob') else date(2000, 1, 1)
+    for key in ['investment_share_p1', 'investment_share_p2', 'fsi_value', 'plan_plot_area', 'plan_built_up', 'plan_floors', 'const_timeline']:
+        try:
+            if details.get(key) not in [None, '']: details[key] = float(details[key])
+        except (ValueError, TypeError): details[key] = 0.0
+    return details
+
 def load_project(project_name):
-    filepath = get_project_filepath(project_name)
     try:
-        df = pd.read_csv(filepath).fillna('')
-        for key, value in df.to_dict('records')[0].items(): st.session_state[key] = value
-        for key in ['mixed_components', 'const_vendors', 'const_green']:
-            if isinstance(st.session_state.get(key), str) and st.session_state[key]: st.session_state[key] = st.session_state[key].split('|')
-            else: st.session_state[key] = []
-        if 'dob' in st.session_state and st.session_state['dob']: st.session_state['dob'] = date.fromisoformat(str(st.session_state['dob']))
-        else: st.session_state['dob'] = date(2000, 1, 1)
-        for key in ['investment_share_p1', 'investment_share_p2', 'fsi_value', 'plan_plot_area', 'plan_built_up', 'plan_floors', 'const_timeline']:
-            try:
-                if st.session_state.get(key) not in [None, '']: st.session_state[key] = float(st.session_state[key])
-            except (ValueError, TypeError): st.session_state[key] = 0.0
-        st.session_state.step = 4
-        st.session_state.ai_response, st.session_state.follow_up_response, st.session_state.active_tool = None, None, None
+        for key, value in read_project_details(project_name).items(): st.session_state[key] = value
+        st.session_state.selected_project, st.session_state.step = project_name, 4
+        st.session_state.ai_response, st.session_state.follow_up_response, st.session_state.active_tool = load_saved_report(project_name, st.session_state.project_version), None, None
+        st.session_state.report_export_path = None
         st.success(t('project_loaded_success').format(project_name=project_name))
     except Exception as e:
         st.error(t('load_project_error').format(project_name=project_name, e=e))
@@ -180,37 +489,100 @@ def load_project(project_name):
 def delete_project(project_name):
     try:
         filepath = get_project_filepath(project_name)
-        if os.path.exists(filepath):
+        with project_lock(project_name):
+            if not os.path.exists(filepath):
+                st.warning(t('project_file_not_found_warning').format(project_name=project_name))
+                return False
             os.remove(filepath)
-            st.success(t('project_deleted_success').format(project_name=project_name))
-            return True
-        else:
-            st.warning(t('project_file_not_found_warning').format(project_name=project_name))
-            return False
+            refresh_project_views(project_name)
+            cancel_report_job(project_name)
+            if os.path.exists(get_report_filepath(project_name)): os.remove(get_report_filepath(project_name))
+        st.success(t('project_deleted_success').format(project_name=project_name))
+        return True
     except Exception as e:
         st.error(t('delete_project_error').format(e=e))
         return False
 
-@st.cache_data
-def get_price_data(city_name: str) -> pd.DataFrame:
-    if not city_name or pd.isna(city_name): city_name = "Default City"
-    city_hash = hash(city_name.lower()); seed = city_hash % (2**32 - 1)
-    np.random.seed(seed)
-    base_prices = {
+def get_report_filepath(project_name):
+    return os.path.join(PROJECTS_DIR, f"{project_name.replace(' ', '_')}.report.md")
+
+def load_saved_report(project_name, project_version):
+    filepath = get_report_filepath(project_name)
+    if not os.path.exists(filepath): return None
+    with open(filepath, encoding="utf-8") as f: header, _, report = f.read().partition("\n")
+    match = re.fullmatch(r"<!-- project_version: (\d+) -->", header)
+    return report or None if match and int(match.group(1)) == project_version else None
+
+@st.cache_resource
+def get_report_queue():
+    return {"executor": ThreadPoolExecutor(max_workers=REPORT_WORKERS, thread_name_prefix="report"), "jobs": {}, "lock": threading.Lock()}
+
+def run_report_job(job, project_name, prompt, temperature):
+    response = MODEL.generate_content(prompt, generation_config={"temperature": temperature})
+    with project_lock(project_name):
+        if not job["cancelled"] and read_project_version(get_project_filepath(project_name)) == job["project_version"]:
+            write_file_atomic(get_report_filepath(project_name), f"<!-- project_version: {job['project_version']} -->\n{response.text}")
+    return response.text
+
+def submit_report_job(project_name, project_version, prompt, temperature=0.4):
+    queue = get_report_queue()
+    with queue["lock"]:
+        expired = time.time() - REPORT_JOB_RETENTION_SECONDS
+        for name in [name for name, old in queue["jobs"].items() if old["future"].done() and old["submitted"] < expired]: del queue["jobs"][name]
+        job = queue["jobs"].get(project_name)
+        if job is None or job["future"].done() or job["project_version"] != project_version:
+            if job is not None: job["cancelled"] = True; job["future"].cancel()
+            job = {"project_version": project_version, "cancelled": False, "submitted": time.time()}
+            job["future"] = queue["executor"].submit(run_report_job, job, project_name, prompt, temperature)
+            queue["jobs"][project_name] = job
+        return job
+
+def get_report_job(project_name):
+    queue = get_report_queue()
+    with queue["lock"]: return queue["jobs"].get(project_name)
+
+def cancel_report_job(project_name):
+    queue = get_report_queue()
+    with queue["lock"]:
+        job = queue["jobs"].pop(project_name, None)
+        if job is not None: job["cancelled"] = True; job["future"].cancel()
+
+def normalize_city(city_name):
+    if not city_name or pd.isna(city_name): return "Default City"
+    return " ".join(str(city_name).split()).title() or "Default City"
+
+def build_market_snapshot(city):
+    city_hash = zlib.crc32(city.lower().encode("utf-8")); rng = np.random.RandomState(city_hash)
+    base_prices = pd.Series({
         "1 BHK Apartment": 4500 + (city_hash % 1500), "2 BHK Apartment": 5500 + (city_hash % 2000),
         "3 BHK Apartment": 6500 + (city_hash % 2500), "Plot / Land": 3000 + (city_hash % 3000),
         "Commercial Space": 8000 + (city_hash % 4000)
-    }
-    data = []
-    for prop_type, base_price in base_prices.items():
-        avg_price = base_price * np.random.uniform(0.98, 1.02)
-        lower_bound = avg_price * 0.85; upper_bound = avg_price * 1.15
-        price_range = f"₹{lower_bound:,.0f} - ₹{upper_bound:,.0f}"
-        data.append({
-            "Property Type": prop_type, "Average Price (per sq.ft)": f"₹{avg_price:,.0f}",
-            "Typical Price Range (per sq.ft)": price_range
-        })
-    return pd.DataFrame(data)
+    })
+    avg_prices = base_prices.to_numpy() * rng.uniform(0.98, 1.02, size=len(base_prices))
+    prices = pd.DataFrame({"Property Type": base_prices.index, "avg_psf": avg_prices, "min_psf": avg_prices * 0.85, "max_psf": avg_prices * 1.15})
+    as_rupees = lambda col: "₹" + prices[col].map("{:,.0f}".format)
+    table = pd.DataFrame({
+        "Property Type": prices["Property Type"], "Average Price (per sq.ft)": as_rupees("avg_psf"),
+        "Typical Price Range (per sq.ft)": as_rupees("min_psf") + " - " + as_rupees("max_psf")
+    })
+    return {"city": city, "prices": prices, "table": table, "markdown": table.to_markdown(index=False), "html": table.to_html(index=False, border=0)}
+
+@st.cache_resource(ttl=MARKET_CATALOG_REFRESH_SECONDS)
+def get_market_catalog():
+    return {"cities": {city: build_market_snapshot(city) for city in MARKET_CITIES}, "lazy": OrderedDict(), "lock": threading.Lock()}
+
+def get_market_snapshot(city_name):
+    city = normalize_city(city_name); catalog = get_market_catalog()
+    snapshot = catalog["cities"].get(city)
+    if snapshot is not None: return snapshot
+    with catalog["lock"]:
+        snapshot = catalog["lazy"].get(city)
+        if snapshot is not None: catalog["lazy"].move_to_end(city); return snapshot
+    snapshot = build_market_snapshot(city)
+    with catalog["lock"]:
+        snapshot = catalog["lazy"].setdefault(city, snapshot); catalog["lazy"].move_to_end(city)
+        if len(catalog["lazy"]) > MARKET_LAZY_CITIES_MAX: catalog["lazy"].popitem(last=False)
+    return snapshot
 
 @st.cache_data
 def get_mock_build_vs_buy_data(loc_city, plan_plot_area, plan_built_up):
@@ -318,6 +690,14 @@ def get_mock_green_savings_data(cost_df):
     savings_data[t("annual_savings_label")] = annual_savings; savings_data[t("payback_period_years_label")] = payback_periods
     return savings_data
 
+def calculate_payback_table(rent_df, total_cost):
+    payback_df = rent_df.copy()
+    net_income_multipliers = { t("rent_type_residential"): (1 - 0.25), t("rent_type_commercial_retail"): (1 - 0.20), t("rent_type_commercial_office"): (1 - 0.15)}
+    for rent_type, multiplier in net_income_multipliers.items():
+        if rent_type in payback_df.columns:
+            net_annual_rent = (payback_df[rent_type] * 12 * multiplier); payback_df[rent_type] = total_cost / net_annual_rent.where(net_annual_rent > 0, np.nan)
+    return payback_df
+
 def calculate_location_quality_score(amenities, connectivity, pollution, crime):
     score_mapping = { 'Low': 1, 'Medium': 2, 'High': 3, 'Not Important': 1, 'Somewhat': 2, 'Very Important': 3 }
     amenities_score = score_mapping.get(amenities, 1) * 1.2
@@ -378,11 +758,104 @@ def get_mock_environmental_risk_data(city, locality):
         eco_risk = np.random.choice(['Medium', 'High'], p=[0.5, 0.5])
     return {"flood": flood_risk, "eco": eco_risk}
 
-@st.cache_data
-def get_mock_vendor_suggestions(city, vendor_type):
-    seed = hash(city.lower() + vendor_type.lower()) % (2**32 - 1)
-    np.random.seed(seed)
-    suggestions = []
+def _polygon_rings(geometry):
+    if geometry["type"] == "Polygon": return [[np.asarray(ring, dtype=np.float64) for ring in geometry["coordinates"]]]
+    if geometry["type"] == "MultiPolygon": return [[np.asarray(ring, dtype=np.float64) for ring in polygon] for polygon in geometry["coordinates"]]
+    return []
+
+def normalize_risk_level(value, default_level):
+    level = str(value if value is not None else '').strip().title()
+    return level if level in RISK_LEVELS else default_level
+
+def load_polygon_layer(filepath, default_level):
+    with open(filepath, encoding="utf-8") as f: features = json.load(f).get("features", [])
+    polygons, levels = [], []
+    for feature in features:
+        for rings in _polygon_rings(feature.get("geometry") or {"type": None}):
+            polygons.append(rings); levels.append(normalize_risk_level((feature.get("properties") or {}).get("risk"), default_level))
+    bounds = np.array([[r[0][:, 0].min(), r[0][:, 1].min(), r[0][:, 0].max(), r[0][:, 1].max()] for r in polygons]).reshape(-1, 4)
+    grid = {}
+    cells = np.floor(bounds / GEO_INDEX_CELL_DEG).astype(int)
+    for i, (x0, y0, x1, y1) in enumerate(cells):
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1): grid.setdefault((cx, cy), []).append(i)
+    return {"polygons": polygons, "levels": levels, "bounds": bounds, "grid": grid}
+
+def load_raster_layer(filepath):
+    with open(filepath.replace(".npy", ".json"), encoding="utf-8") as f: header = json.load(f)
+    return {"data": np.load(filepath, mmap_mode="r"), **header}
+
+def _point_in_ring(lon, lat, ring):
+    x0, y0, x1, y1 = ring[:-1, 0], ring[:-1, 1], ring[1:, 0], ring[1:, 1]
+    crosses = (y0 > lat) != (y1 > lat)
+    with np.errstate(divide="ignore", invalid="ignore"): x_cross = x0 + (lat - y0) * (x1 - x0) / (y1 - y0)
+    return bool(np.count_nonzero(crosses & (lon < x_cross)) % 2)
+
+def polygon_levels_at(layer, lon, lat):
+    if layer is None: return []
+    levels = []
+    for i in layer["grid"].get((math.floor(lon / GEO_INDEX_CELL_DEG), math.floor(lat / GEO_INDEX_CELL_DEG)), []):
+        x0, y0, x1, y1 = layer["bounds"][i]
+        if not (x0 <= lon <= x1 and y0 <= lat <= y1): continue
+        outer, *holes = layer["polygons"][i]
+        if _point_in_ring(lon, lat, outer) and not any(_point_in_ring(lon, lat, hole) for hole in holes): levels.append(layer["levels"][i])
+    return levels
+
+def sample_raster(layer, lons, lats):
+    lons, lats = np.atleast_1d(np.asarray(lons, dtype=np.float64)), np.atleast_1d(np.asarray(lats, dtype=np.float64))
+    values = np.full(lons.shape, np.nan)
+    if layer is None: return values
+    rows = np.floor((layer["origin_lat"] - lats) / layer["cell_size"]).astype(int); cols = np.floor((lons - layer["origin_lon"]) / layer["cell_size"]).astype(int)
+    inside = (rows >= 0) & (rows < layer["data"].shape[0]) & (cols >= 0) & (cols < layer["data"].shape[1])
+    values[inside] = layer["data"][rows[inside], cols[inside]]
+    if layer.get("nodata") is not None: values[values == layer["nodata"]] = np.nan
+    return values
+
+@st.cache_resource
+def get_geo_layers():
+    path = lambda name: os.path.join(GEO_DATA_DIR, name)
+    gazetteer = pd.read_csv(path("gazetteer.csv"), dtype={"pincode": str}, keep_default_na=False) if os.path.exists(path("gazetteer.csv")) else pd.DataFrame(columns=["pincode", "locality", "city", "lat", "lon"])
+    gazetteer["lat"], gazetteer["lon"] = pd.to_numeric(gazetteer["lat"], errors="coerce"), pd.to_numeric(gazetteer["lon"], errors="coerce")
+    gazetteer = gazetteer[gazetteer["lat"].between(-90, 90) & gazetteer["lon"].between(-180, 180)].copy()
+    gazetteer["key"] = gazetteer["city"].map(normalize_city) + "|" + gazetteer["locality"].str.strip().str.lower()
+    return {
+        "by_pincode": gazetteer.drop_duplicates("pincode").set_index("pincode")[["lat", "lon"]].to_dict("index"),
+        "by_locality": gazetteer.drop_duplicates("key").set_index("key")[["lat", "lon"]].to_dict("index"),
+        "flood_zones": load_polygon_layer(path("flood_zones.geojson"), "High") if os.path.exists(path("flood_zones.geojson")) else None,
+        "protected_areas": load_polygon_layer(path("protected_areas.geojson"), "High") if os.path.exists(path("protected_areas.geojson")) else None,
+        "elevation": load_raster_layer(path("elevation.npy")) if os.path.exists(path("elevation.npy")) else None,
+        "flood_depth": load_raster_layer(path("flood_depth.npy")) if os.path.exists(path("flood_depth.npy")) else None,
+    }
+
+def resolve_location(city, locality, pincode):
+    layers = get_geo_layers(); pincode = str(pincode or '').strip()
+    point = layers["by_pincode"].get(pincode) if pincode else None
+    if point is None: point = layers["by_locality"].get(f"{normalize_city(city)}|{(locality or '').strip().lower()}")
+    return (float(point["lon"]), float(point["lat"])) if point else None
+
+def _max_risk_level(levels):
+    return max(levels, key=RISK_LEVELS.index) if levels else 'Low'
+
+def score_environmental_risk_batch(lons, lats):
+    layers = get_geo_layers()
+    depths, elevations = sample_raster(layers["flood_depth"], lons, lats), sample_raster(layers["elevation"], lons, lats)
+    depth_levels = np.where(depths >= FLOOD_DEPTH_HIGH_M, 'High', np.where(depths > FLOOD_DEPTH_MEDIUM_M, 'Medium', 'Low'))
+    results = []
+    for lon, lat, depth, elevation, depth_level in zip(np.atleast_1d(lons), np.atleast_1d(lats), depths, elevations, depth_levels):
+        results.append({
+            "flood": _max_risk_level(polygon_levels_at(layers["flood_zones"], lon, lat) + [depth_level]),
+            "eco": _max_risk_level(polygon_levels_at(layers["protected_areas"], lon, lat)),
+            "flood_depth_m": None if np.isnan(depth) else float(depth), "elevation_m": None if np.isnan(elevation) else float(elevation),
+        })
+    return pd.DataFrame(results)
+
+@st.cache_data(max_entries=10000)
+def get_environmental_risk_data(city, locality, pincode):
+    location = resolve_location(city, locality, pincode)
+    if location is None: return {**get_mock_environmental_risk_data(city or '', locality or ''), "flood_depth_m": None, "elevation_m": None, "source": "heuristic"}
+    return {**score_environmental_risk_batch([location[0]], [location[1]]).iloc[0].to_dict(), "source": "gis"}
+
+def build_default_vendor_catalog():
     names = {
         'Construction': ["{city} Builders", "Pinnacle Constructions", "Solid Rock Infra", "Dream Homes Pvt. Ltd.", "Vision Associates"],
         'Interiors': ["Creative Corners", "Design Aesthetics", "{city} Interiors", "The Style Studio", "Perfect Finish Designers"],
@@ -397,15 +870,62 @@ def get_mock_vendor_suggestions(city, vendor_type):
         'Plumbing': ["New Installations", "Maintenance & Repair", "Large-scale Projects", "Sanitary Fittings", "Waterproofing"],
         'Electrical': ["Complete House Wiring", "Commercial Installations", "Smart Home Automation", "Safety Audits", "Fixture Installation"]
     }
-    vendor_names = names.get(vendor_type, ["Generic Vendor A", "Generic Vendor B", "Generic Vendor C"])
-    vendor_specialties = specialties.get(vendor_type, ["General Services"])
-    for _ in range(np.random.randint(3, 5)):
-        suggestions.append({
-            "name": np.random.choice(vendor_names).format(city=city), "specialty": np.random.choice(vendor_specialties),
-            "rating": round(np.random.uniform(3.8, 4.9), 1),
-            "review": np.random.choice([ "Highly professional and timely delivery.", "Good quality work, slightly over budget.", "Excellent communication and support.", "Recommended for their expertise in the field.", "Satisfactory results, great value for money." ])
-        })
-    return pd.DataFrame(suggestions).drop_duplicates(subset=['name']).to_dict('records')
+    reviews = ["Highly professional and timely delivery.", "Good quality work, slightly over budget.", "Excellent communication and support.", "Recommended for their expertise in the field.", "Satisfactory results, great value for money."]
+    rows = []
+    for city in [c for c in MARKET_CITIES if c != "Default City"] + [""]:
+        for vendor_type, templates in names.items():
+            for template in templates:
+                seed = zlib.crc32(f"{city}|{vendor_type}|{template}".encode("utf-8"))
+                rows.append({"city": city, "vendor_type": vendor_type, "name": template if not city else template.format(city=city), "specialty": specialties[vendor_type][seed % 5],
+                             "rating": round(3.5 + (seed >> 4) % 15 / 10, 1), "review_count": 5 + (seed >> 8) % 400, "review": reviews[(seed >> 12) % len(reviews)]})
+    return pd.DataFrame(rows)
+
+@st.cache_resource
+def get_vendor_catalog():
+    catalog = pd.read_csv(VENDORS_FILE, keep_default_na=False) if os.path.exists(VENDORS_FILE) else build_default_vendor_catalog()
+    catalog["city"] = catalog["city"].map(lambda c: normalize_city(c) if c else "")
+    catalog["rating"] = catalog["rating"].astype(float); catalog["review_count"] = catalog["review_count"].astype(int)
+    mean_rating = catalog["rating"].mean() if len(catalog) else 0.0
+    catalog["score"] = (VENDOR_RATING_PRIOR_REVIEWS * mean_rating + catalog["rating"] * catalog["review_count"]) / (VENDOR_RATING_PRIOR_REVIEWS + catalog["review_count"])
+    catalog = catalog.sort_values(["score", "review_count"], ascending=False, kind="stable").reset_index(drop=True)
+    index = {}
+    for (city, vendor_type, specialty), ids in catalog.groupby(["city", "vendor_type", "specialty"], sort=False).indices.items():
+        index.setdefault((city, vendor_type, None), []).extend(ids); index[(city, vendor_type, specialty)] = ids
+    index = {key: np.sort(np.asarray(ids)) for key, ids in index.items()}
+    return {"vendors": catalog, "index": index}
+
+def _vendor_ids(city_name, vendor_type, specialty=None):
+    catalog = get_vendor_catalog(); city = normalize_city(city_name)
+    city_key = city if (city, vendor_type, None) in catalog["index"] else ""
+    ids = catalog["index"].get((city_key, vendor_type, specialty), np.empty(0, dtype=int))
+    return catalog["vendors"], ids, city if city_name else "Local"
+
+def _vendor_records(vendors, ids, city):
+    records = vendors.iloc[ids][["city", "name", "specialty", "rating", "review_count", "review"]].to_dict('records')
+    for record in records:
+        if not record.pop("city"): record["name"] = record["name"].replace("{city}", city)
+    return records
+
+def get_vendor_specialties(city_name, vendor_type):
+    vendors, ids, _ = _vendor_ids(city_name, vendor_type)
+    return sorted(vendors["specialty"].iloc[ids].unique())
+
+def count_vendors(city_name, vendor_type, specialty=None):
+    return len(_vendor_ids(city_name, vendor_type, specialty)[1])
+
+def search_vendors(city_name, vendor_type, specialty=None, page=0, page_size=VENDOR_PAGE_SIZE):
+    vendors, ids, city = _vendor_ids(city_name, vendor_type, specialty)
+    return _vendor_records(vendors, ids[page * page_size:(page + 1) * page_size], city)
+
+def get_vendor_matches(city_name, vendor_types, top_k=VENDOR_TOP_MATCHES):
+    vendor_types = list(dict.fromkeys(vendor_types))
+    if not vendor_types: return {}
+    lookups = [_vendor_ids(city_name, vendor_type) for vendor_type in vendor_types]
+    vendors, city = lookups[0][0], lookups[0][2]
+    top_ids = [ids[:top_k] for _, ids, _ in lookups]
+    records = _vendor_records(vendors, np.concatenate(top_ids), city)
+    bounds = np.cumsum([0] + [len(ids) for ids in top_ids])
+    return {vendor_type: records[bounds[i]:bounds[i + 1]] for i, vendor_type in enumerate(vendor_types)}
 
 def get_loan_subsidy_info(income):
     info = {}
@@ -440,8 +960,8 @@ def render_build_specifics():
     st.number_input(t('floors_label'), min_value=1, value=int(st.session_state.get('plan_floors', 2)), key='plan_floors')
     st.checkbox(t('extra_floors_rent_checkbox'), key='extra_floors_rent')
     st.selectbox(t('contract_type_label'), ['With Material (Turnkey)', 'Without Material (Labor Only)'], key='const_contract')
-    st.multiselect(t('vendors_label'), ['Plumbing', 'Electrical', 'Tiles', 'Paint', 'Solar', 'Interiors', 'CCTV', 'Automation', 'Landscaping'], key='const_vendors')
-    st.multiselect(t('green_features_label'), ['Solar Panels', 'Rainwater Harvesting', 'Heat Insulation', 'EV Charging Point', 'Greywater Recycling'], key='const_green')
+    st.multiselect(t('vendors_label'), VENDOR_OPTIONS, key='const_vendors')
+    st.multiselect(t('green_features_label'), GREEN_OPTIONS, key='const_green')
     st.slider(t('timeline_label'), 3, 36, value=int(st.session_state.get('const_timeline', 12)), key='const_timeline')
 
 def render_investment_specifics(purpose):
@@ -531,11 +1051,7 @@ def render_payback_calculator_tool():
     st.subheader(f"⏳ {t('tool_payback_calculator_title')}"); st.info(t('tool_payback_calculator_info'))
     with st.container(border=True):
         total_cost = st.session_state.get('fin_budget', 5000000); built_up_area = st.session_state.get('plan_built_up', 1000.0)
-        rent_df = get_mock_hyperlocal_rent_forecast(st.session_state.get('loc_city'), st.session_state.get('loc_locality'), built_up_area); payback_df = rent_df.copy()
-        net_income_multipliers = { t("rent_type_residential"): (1 - 0.25), t("rent_type_commercial_retail"): (1 - 0.20), t("rent_type_commercial_office"): (1 - 0.15)}
-        for rent_type, multiplier in net_income_multipliers.items():
-            if rent_type in payback_df.columns:
-                net_annual_rent = (payback_df[rent_type] * 12 * multiplier); payback_df[rent_type] = total_cost / net_annual_rent.where(net_annual_rent > 0, np.nan)
+        rent_df = get_mock_hyperlocal_rent_forecast(st.session_state.get('loc_city'), st.session_state.get('loc_locality'), built_up_area); payback_df = calculate_payback_table(rent_df, total_cost)
         st.subheader(t('payback_period_label'))
         st.dataframe(payback_df, use_container_width=True, hide_index=True, column_config={t("rent_type_residential"): st.column_config.NumberColumn(format="%.1f Yrs"), t("rent_type_commercial_retail"): st.column_config.NumberColumn(format="%.1f Yrs"), t("rent_type_commercial_office"): st.column_config.NumberColumn(format="%.1f Yrs")})
 
@@ -578,7 +1094,7 @@ def render_compare_localities_tool():
 
 def render_environmental_risk_tool():
     st.subheader(f"🏞️ {t('tool_env_risk_title')}"); st.info(t('tool_env_risk_info'))
-    risk_data = get_mock_environmental_risk_data(st.session_state.get('loc_city', ''), st.session_state.get('loc_locality', ''))
+    risk_data = get_environmental_risk_data(st.session_state.get('loc_city', ''), st.session_state.get('loc_locality', ''), st.session_state.get('loc_pincode', ''))
     with st.container(border=True):
         st.subheader(f"{t('risk_assessment_for_label')} {st.session_state.get('loc_locality', 'N/A').title()}, {st.session_state.get('loc_city', 'N/A').title()}")
         c1, c2 = st.columns(2)
@@ -588,30 +1104,42 @@ def render_environmental_risk_tool():
             if risk_level == 'High': st.error(f"**{t('risk_level_high')}** 💧", icon="🚨"); st.warning(t('risk_advice_high'))
             elif risk_level == 'Medium': st.warning(f"**{t('risk_level_medium')}** 💧", icon="⚠️"); st.info(t('risk_advice_medium'))
             else: st.success(f"**{t('risk_level_low')}** 💧", icon="✅"); st.markdown(t('risk_advice_low'))
+            if risk_data['flood_depth_m'] is not None: st.metric(t('flood_depth_label'), f"{risk_data['flood_depth_m']:.1f} m")
+            if risk_data['elevation_m'] is not None: st.metric(t('elevation_label'), f"{risk_data['elevation_m']:,.0f} m")
         with c2:
             st.markdown(f"**{t('eco_risk_label')}**")
             risk_level = risk_data['eco']
             if risk_level == 'High': st.error(f"**{t('risk_level_high')}** 🌳", icon="🚨"); st.warning(t('risk_advice_high'))
             elif risk_level == 'Medium': st.warning(f"**{t('risk_level_medium')}** 🌳", icon="⚠️"); st.info(t('risk_advice_medium'))
             else: st.success(f"**{t('risk_level_low')}** 🌳", icon="✅"); st.markdown(t('risk_advice_low'))
+        st.caption(t('risk_source_gis_caption') if risk_data['source'] == 'gis' else t('risk_source_heuristic_caption'))
+
+def render_vendor_card(vendor):
+    with st.container(border=True):
+        c1, c2 = st.columns([3, 1])
+        with c1: st.subheader(vendor['name']); st.caption(f"{t('vendor_specialty_label')}: {vendor['specialty']}"); st.markdown(f"*{vendor['review']}*")
+        with c2: st.metric(label=t('vendor_rating_label'), value=f"{vendor['rating']} ⭐"); st.caption(t('vendor_reviews_caption').format(count=vendor['review_count']))
 
 def render_vendor_suggestion_tool():
     st.subheader(f"👷 {t('tool_vendor_suggestion_title')}"); st.info(t('tool_vendor_suggestion_info'))
+    city = st.session_state.get('loc_city', '')
     vendor_map = { 'Plumbing': 'Plumbing', 'Electrical': 'Electrical', 'Solar': 'Solar', 'Interiors': 'Interiors' }
     user_needs = [vendor_map[v] for v in st.session_state.get('const_vendors', []) if v in vendor_map]
+    if user_needs:
+        st.markdown(f"##### {t('vendor_top_matches_header')}")
+        for vendor_type, vendors in get_vendor_matches(city, user_needs).items():
+            for vendor in vendors: st.markdown(f"**{vendor_type}** · {vendor['name']} — {vendor['rating']} ⭐ ({t('vendor_reviews_caption').format(count=vendor['review_count'])})")
+        st.divider()
     all_vendor_types = ['Construction', 'Interiors', 'Solar', 'Plumbing', 'Electrical']
     sorted_vendor_types = sorted(list(set(user_needs + all_vendor_types)), key=lambda x: (x not in user_needs))
-    selected_type = st.selectbox(t('vendor_type_label'), options=sorted_vendor_types)
-    if selected_type:
-        with st.spinner(f"Searching for {selected_type} vendors in {st.session_state.get('loc_city', 'your city')}..."):
-            suggestions = get_mock_vendor_suggestions(st.session_state.get('loc_city', ''), selected_type)
-            if not suggestions: st.warning("No suggestions found for this category.")
-            else:
-                for vendor in suggestions:
-                    with st.container(border=True):
-                        c1, c2 = st.columns([3, 1])
-                        with c1: st.subheader(vendor['name']); st.caption(f"{t('vendor_specialty_label')}: {vendor['specialty']}"); st.markdown(f"*{vendor['review']}*")
-                        with c2: st.metric(label=t('vendor_rating_label'), value=f"{vendor['rating']} ⭐")
+    c1, c2 = st.columns(2)
+    selected_type = c1.selectbox(t('vendor_type_label'), options=sorted_vendor_types)
+    specialty = c2.selectbox(t('vendor_specialty_label'), options=get_vendor_specialties(city, selected_type), index=None, placeholder=t('any_specialty_option'))
+    pages = max(1, math.ceil(count_vendors(city, selected_type, specialty) / VENDOR_PAGE_SIZE)); page = 1
+    if pages > 1: page = st.number_input(t('search_page_label').format(pages=pages), min_value=1, max_value=pages, value=1, step=1)
+    suggestions = search_vendors(city, selected_type, specialty, page=page - 1)
+    if not suggestions: st.warning("No suggestions found for this category.")
+    for vendor in suggestions: render_vendor_card(vendor)
 
 def render_loan_guide_tool():
     st.subheader(f"🏦 {t('tool_loan_guide_title')}"); st.info(t('tool_loan_guide_info'))
@@ -651,18 +1179,53 @@ def display_sidebar():
                 new_project_name = st.text_input(t('new_project_name_label'), key="new_proj_name").strip()
                 if st.form_submit_button(t('start_new_project_button'), use_container_width=True):
                     if new_project_name:
-                        if new_project_name in get_saved_projects(): st.error(t('project_name_exists_error'))
+                        if project_exists(new_project_name): st.error(t('project_name_exists_error'))
                         else:
                             lang = st.session_state.language; st.session_state.clear(); st.session_state.language, st.session_state.step = lang, 1
                             st.session_state.selected_project = new_project_name; st.rerun()
                     else: st.warning(t('enter_project_name_warning'))
-        saved_projects = get_saved_projects()
-        if saved_projects:
+        if get_project_index()["entries"]:
             with st.container(border=True):
                 st.subheader(t('load_existing_project_header'))
-                selected_to_load = st.selectbox(t('select_project_placeholder'), options=saved_projects, index=None, placeholder=t('select_project_placeholder'))
+                query = st.text_input(t('search_projects_label'), key='project_search', placeholder=t('search_projects_placeholder'))
+                with st.expander(t('filter_projects_expander')):
+                    filter_city = st.text_input(t('target_city_label'), key='project_filter_city')
+                    intent_keys = ['buy_flat', 'build_house', 'buy_plot', 'mixed_investment']
+                    filter_intent = st.selectbox(t('select_goal_label'), options=intent_keys, format_func=t, index=None, key='project_filter_intent')
+                    c1, c2 = st.columns(2)
+                    budget_min = c1.number_input(t('filter_budget_min_label'), min_value=0, step=100000, key='project_filter_budget_min')
+                    budget_max = c2.number_input(t('filter_budget_max_label'), min_value=0, step=100000, key='project_filter_budget_max')
+                    filter_owner = st.text_input(t('full_name_label'), key='project_filter_owner')
+                    filter_vendors = tuple(st.multiselect(t('vendors_label'), VENDOR_OPTIONS, key='project_filter_vendors'))
+                    filter_green = tuple(st.multiselect(t('green_features_label'), GREEN_OPTIONS, key='project_filter_green'))
+                matches = search_projects(query, filter_city, filter_intent, budget_min, budget_max, filter_owner)
+                if filter_vendors or filter_green:
+                    allowed = filter_project_names(filter_project_store(vendors=filter_vendors, green=filter_green)); matches = [m for m in matches if m in allowed]
+                pages = max(1, math.ceil(len(matches) / PROJECT_SEARCH_PAGE_SIZE)); page = 1
+                if pages > 1: page = st.number_input(t('search_page_label').format(pages=pages), min_value=1, max_value=pages, value=1, step=1)
+                st.caption(t('search_results_caption').format(total=len(matches)))
+                page_matches = matches[(page - 1) * PROJECT_SEARCH_PAGE_SIZE:page * PROJECT_SEARCH_PAGE_SIZE]
+                if not matches: st.info(t('no_matching_projects_info'))
+                selected_to_load = st.selectbox(t('select_project_placeholder'), options=page_matches, index=None, placeholder=t('select_project_placeholder'))
                 if st.button(t('load_project_button'), use_container_width=True, disabled=not selected_to_load):
                     load_project(selected_to_load); st.rerun()
+                if matches and st.button(t('batch_export_button').format(count=len(matches)), use_container_width=True):
+                    try: st.session_state.batch_export_job = submit_batch_export(matches)
+                    except Exception as e: st.session_state.batch_export_job = None; st.error(t('report_export_error').format(err=e))
+                    else:
+                        if st.session_state.batch_export_job is None: st.warning(t('batch_export_empty_warning'))
+                batch_job = st.session_state.get('batch_export_job')
+                if batch_job is not None:
+                    if not batch_job["future"].done(): watch_batch_export(batch_job)
+                    elif batch_job["future"].exception() is not None: st.error(t('report_export_error').format(err=batch_job["future"].exception()))
+                    elif os.path.exists(batch_job["zip_path"]):
+                        with open(batch_job["zip_path"], "rb") as f: st.download_button(t('download_batch_button'), f.read(), file_name="reports.zip", mime="application/zip", use_container_width=True)
+            with st.expander(f"📊 {t('portfolio_overview_header')}"):
+                summary = get_portfolio_summary(project_store_generation(), filter_city, filter_intent, budget_min, budget_max, filter_vendors, filter_green); c1, c2 = st.columns(2)
+                c1.metric(t('portfolio_projects_label'), f"{summary['count']:,}"); c2.metric(t('portfolio_avg_budget_label'), f"₹{summary['mean_budget']:,.0f}")
+                st.dataframe(summary['by_city'].head(10), use_container_width=True, hide_index=True, column_config={
+                    'loc_city': t('target_city_label'), 'count': t('portfolio_projects_label'),
+                    'mean_budget': st.column_config.NumberColumn(t('portfolio_avg_budget_label'), format="₹%,.0f")})
         st.info(t('disclaimer_info'), icon="📢")
 
 def display_step1_user_details():
@@ -745,6 +1308,12 @@ def display_step3_details():
             st.rerun()
 
 
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def watch_report_job(project_name, project_version):
+    job = get_report_job(project_name)
+    if job is None or job["project_version"] != project_version or job["future"].done(): st.rerun()
+    st.info(t('analyzing_spinner')); st.caption(t('report_queued_info'))
+
 def display_step4_analysis():
     st.subheader(t('step4_header')); st.success(t('project_saved_success'))
     project_details = {key: st.session_state.get(key) for key in CSV_COLUMNS if st.session_state.get(key) not in [None, '']}
@@ -752,31 +1321,55 @@ def display_step4_analysis():
         display_details = {key.replace('_', ' ').title(): val for key, val in project_details.items() if val and key != 'project_name'}
         st.json(display_details)
     st.divider()
-    city = project_details.get('loc_city', "Your City"); st.subheader(t('market_snapshot_header').format(city=city.title())); st.dataframe(get_price_data(city), use_container_width=True, hide_index=True); st.divider()
+    market = get_market_snapshot(project_details.get('loc_city')); st.subheader(t('market_snapshot_header').format(city=market['city'])); st.dataframe(market['table'], use_container_width=True, hide_index=True); st.divider()
     col1, col2 = st.columns([3, 1])
     with col1:
         if st.button(t('generate_strategy_button'), type="primary", use_container_width=True):
             prompt = build_initial_prompt(project_details, st.session_state.language)
-            with st.spinner(t('analyzing_spinner')): st.session_state.ai_response = ask_gemini(prompt)
-            st.session_state.follow_up_response = None
+            submit_report_job(st.session_state.selected_project, st.session_state.project_version, prompt)
+            st.session_state.ai_response, st.session_state.follow_up_response, st.session_state.report_export_path = None, None, None
     with col2:
         if st.button(t('edit_details_button'), use_container_width=True): 
             st.session_state.step = 3
             st.rerun()
 
+    if not st.session_state.get('ai_response'):
+        job = get_report_job(st.session_state.selected_project)
+        if job is not None and job["project_version"] == st.session_state.project_version:
+            if not job["future"].done(): watch_report_job(st.session_state.selected_project, st.session_state.project_version)
+            elif job["future"].exception() is not None: st.error(t('report_job_error').format(err=job["future"].exception()), icon="🤖")
+            else: st.session_state.ai_response = job["future"].result()
+        else: st.session_state.ai_response = load_saved_report(st.session_state.selected_project, st.session_state.project_version)
+
     if st.session_state.get('ai_response'):
         st.markdown("---"); col1, col2 = st.columns([3,1])
         with col1: st.subheader(t('strategy_header'))
         with col2:
-            if st.button(t('print_report_button'), use_container_width=True): st.components.v1.html("<script>window.print()</script>", height=0)
+            if st.button(t('export_report_button'), use_container_width=True):
+                try: st.session_state.report_export_path = export_report(render_report_html(st.session_state.selected_project, project_details, st.session_state.ai_response))
+                except Exception as e: st.error(t('report_export_error').format(err=e))
+            export_path = st.session_state.get('report_export_path')
+            if export_path and os.path.exists(export_path):
+                is_pdf = export_path.endswith(".pdf")
+                with open(export_path, "rb") as f:
+                    st.download_button(t('download_pdf_button') if is_pdf else t('download_html_button'), f.read(), file_name=f"{st.session_state.selected_project.replace(' ', '_')}{os.path.splitext(export_path)[1]}", mime="application/pdf" if is_pdf else "text/html", use_container_width=True)
         st.markdown(st.session_state.ai_response, unsafe_allow_html=True); st.markdown("---")
         with st.expander(t('follow_up_expander')):
             question = st.text_area(t('follow_up_expander'), placeholder=t('follow_up_placeholder'))
             if st.button(t('ask_advisor_button')):
                 if question:
-                    prompt = build_follow_up_prompt(project_details, st.session_state.ai_response, question, st.session_state.language)
-                    with st.spinner(t('thinking_spinner')): st.session_state.follow_up_response = ask_gemini(prompt, temperature=0.5)
+                    context_key = semantic_cache_context_key(st.session_state.ai_response, st.session_state.language)
+                    cached = semantic_cache_lookup(context_key, question)
+                    if cached: st.session_state.follow_up_response, st.session_state.follow_up_cached = cached, True
+                    else:
+                        prompt = build_follow_up_prompt(project_details, st.session_state.ai_response, question, st.session_state.language)
+                        with st.spinner(t('thinking_spinner')): st.session_state.follow_up_response = ask_gemini(prompt, temperature=0.5)
+                        st.session_state.follow_up_cached = False
+                        if st.session_state.follow_up_response != GEMINI_FALLBACK_RESPONSE: semantic_cache_store(context_key, question, st.session_state.follow_up_response)
                 else: st.warning(t('enter_question_warning'))
+            stats = get_semantic_cache_stats()
+            if stats['lookups']: st.caption(t('follow_up_cache_stats_caption').format(**stats))
+        if st.session_state.get('follow_up_response') and st.session_state.get('follow_up_cached'): st.caption(t('follow_up_cache_hit_caption'))
         if st.session_state.get('follow_up_response'): st.info(st.session_state.follow_up_response)
         st.divider()
         st.subheader(t('advanced_tools_header'))
@@ -827,6 +1420,111 @@ def display_advanced_tool_ui():
     elif tool == 'vendor_suggestion': render_vendor_suggestion_tool()
     elif tool == 'loan_guide': render_loan_guide_tool()
 
+@st.cache_resource
+def get_report_template():
+    font_css = f'@font-face {{ font-family: report; src: url("{os.path.abspath(REPORT_FONT_FILE)}"); }} body {{ font-family: report; }}' if os.path.exists(REPORT_FONT_FILE) else ""
+    return string.Template(string.Template(REPORT_HTML_TEMPLATE).safe_substitute(font_css=font_css))
+
+def markdown_to_html(text):
+    if markdown is None: return f"<pre>{html.escape(text)}</pre>"
+    return markdown.markdown(text.replace("<", "&lt;"), extensions=["tables"])
+
+def build_report_tables(details):
+    city, locality = details.get('loc_city') or '', details.get('loc_locality') or ''
+    built_up = float(details.get('plan_built_up') or 1800.0); size = float(details.get('plan_built_up') or details.get('plan_plot_area') or 1200.0)
+    build_vs_buy = get_mock_build_vs_buy_data(city, details.get('plan_plot_area'), details.get('plan_built_up'))
+    build_vs_buy_rows = [(t('land_cost'), build_vs_buy['build']['land']), (t('construction_cost'), build_vs_buy['build']['construction']), (t('other_costs'), build_vs_buy['build']['other']),
+                         (t('total_build_cost'), build_vs_buy['build']['total']), (t('cost_per_flat_build_label'), build_vs_buy['build']['cost_per_flat']), (t('price_ready_flat_label'), build_vs_buy['buy']['total_single_flat'])]
+    rent_df = get_mock_hyperlocal_rent_forecast(city, locality, built_up)
+    return [
+        (t('tool_build_vs_buy_title'), pd.DataFrame([{t('cost_item_label'): item, t('cost_price_label'): f"₹{amount:,.0f}"} for item, amount in build_vs_buy_rows])),
+        (t('tool_resale_predictor_title'), get_mock_resale_projection_data(city, locality, size)['table']),
+        (t('tool_payback_calculator_title'), calculate_payback_table(rent_df, float(details.get('fin_budget') or 5000000))),
+        (t('tool_green_savings_predictor_title'), get_mock_green_savings_data(get_mock_green_cost_data(city, built_up))),
+    ]
+
+def render_report_html(project_name, details, report_md):
+    tables_html = "".join(f"<h3>{html.escape(title)}</h3>{df.to_html(index=False, border=0, float_format=lambda v: f'{v:,.1f}')}" for title, df in build_report_tables(details))
+    return get_report_template().substitute(
+        lang=st.session_state.language, title=html.escape(t('strategy_header')), project_name=html.escape(project_name),
+        report_html=markdown_to_html(report_md), tables_header=html.escape(t('report_tables_header')), tables_html=tables_html)
+
+def get_export_filepath(html_doc):
+    digest = hashlib.sha256(html_doc.encode("utf-8")).hexdigest()
+    return os.path.join(EXPORTS_DIR, f"{digest}.pdf" if pisa is not None else f"{digest}.html")
+
+def prune_exports():
+    entries = sorted((entry for entry in os.scandir(EXPORTS_DIR) if entry.is_file() and not entry.name.endswith(".tmp")), key=lambda entry: entry.stat().st_mtime, reverse=True)
+    expired = time.time() - EXPORT_RETENTION_SECONDS
+    for index, entry in enumerate(entries):
+        if index >= EXPORT_MAX_FILES or entry.stat().st_mtime < expired:
+            try: os.remove(entry.path)
+            except FileNotFoundError: pass
+
+def reuse_export(filepath):
+    try: os.utime(filepath); return True
+    except FileNotFoundError: return False
+
+def export_report(html_doc):
+    filepath = get_export_filepath(html_doc)
+    if reuse_export(filepath): return filepath
+    write_file_atomic(filepath, html_to_pdf(html_doc, REPORT_PDF_RESOURCES) if pisa is not None else html_doc)
+    prune_exports()
+    return filepath
+
+# Spawned workers re-import this script as __mp_main__; main() stays behind the __name__ guard, so only html_to_pdf runs there.
+@st.cache_resource
+def get_export_pool():
+    return ProcessPoolExecutor(max_workers=EXPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+def prepare_report_batch(project_names):
+    jobs = []
+    for project_name in project_names:
+        details = read_project_details(project_name); report_md = load_saved_report(project_name, details['project_version'])
+        if report_md: jobs.append((project_name, render_report_html(project_name, details, report_md)))
+    return jobs
+
+def export_reports_batch(jobs, zip_path):
+    if reuse_export(zip_path): return zip_path
+    filepaths = [get_export_filepath(html_doc) for _, html_doc in jobs]
+    pending = [(html_doc, filepath) for (_, html_doc), filepath in zip(jobs, filepaths) if not reuse_export(filepath)]
+    if pisa is not None and EXPORT_WORKERS > 1 and len(pending) > 1:
+        try: documents = list(get_export_pool().map(partial(html_to_pdf, allowed_files=REPORT_PDF_RESOURCES), [html_doc for html_doc, _ in pending]))
+        except BrokenProcessPool: get_export_pool.clear(); raise
+        for (_, filepath), document in zip(pending, documents): write_file_atomic(filepath, document)
+    else:
+        for html_doc, _ in pending: export_report(html_doc)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for (project_name, _), filepath in zip(jobs, filepaths): archive.write(filepath, f"{project_name.replace(' ', '_')}{os.path.splitext(filepath)[1]}")
+    write_file_atomic(zip_path, buffer.getvalue())
+    prune_exports()
+    return zip_path
+
+@st.cache_resource
+def get_batch_export_queue():
+    return {"executor": ThreadPoolExecutor(max_workers=1, thread_name_prefix="export"), "jobs": {}, "lock": threading.Lock()}
+
+def submit_batch_export(project_names):
+    jobs = prepare_report_batch(project_names)
+    if not jobs: return None
+    digest = hashlib.sha256("\n".join(f"{project_name}\t{get_export_filepath(html_doc)}" for project_name, html_doc in jobs).encode("utf-8")).hexdigest()
+    zip_path = os.path.join(EXPORTS_DIR, f"batch-{digest}.zip"); queue = get_batch_export_queue()
+    with queue["lock"]:
+        expired = time.time() - REPORT_JOB_RETENTION_SECONDS
+        for key in [key for key, old in queue["jobs"].items() if old["future"].done() and old["submitted"] < expired]: del queue["jobs"][key]
+        job = queue["jobs"].get(zip_path)
+        if job is None or (job["future"].done() and (job["future"].exception() is not None or not os.path.exists(zip_path))):
+            job = {"zip_path": zip_path, "count": len(jobs), "submitted": time.time()}
+            job["future"] = queue["executor"].submit(export_reports_batch, jobs, zip_path)
+            queue["jobs"][zip_path] = job
+        return job
+
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def watch_batch_export(job):
+    if job["future"].done(): st.rerun()
+    st.info(t('batch_export_running_info').format(count=job["count"]))
+
 def calculate_age(born):
     if not isinstance(born, date): return "N/A"
     today = date.today(); return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
@@ -840,7 +1538,7 @@ def build_initial_prompt(details, lang_code):
         if plot_area > 0 and fsi > 0: client_profile += f"\n**CONSTRUCTION CONSTRAINTS:**\n- Plot Area: {plot_area:,.0f} sq. ft\n- Floor Space Index (FSI): {fsi}\n- Maximum Permissible Construction Area: {plot_area * fsi:,.0f} sq. ft\n"
     return textwrap.dedent(f"""Act as a meticulous financial real estate analyst in India. Your goal is to provide a report that is 85% quantitative data, in clear Markdown tables. IMPORTANT: Your entire response, including all headers, table content, and text, MUST be in the {language_name} language.
         {client_profile}
-        **MARKET DATA for {details.get('loc_city', 'your city')}:**\n{get_price_data(details.get('loc_city', '')).to_markdown(index=False)}
+        **MARKET DATA for {details.get('loc_city', 'your city')}:**\n{get_market_snapshot(details.get('loc_city'))['markdown']}
         ---
         **YOUR TASK: Generate a detailed, number-focused financial report. If the investment is joint, acknowledge this. If building a house or analyzing a plot, you MUST respect the 'Maximum Permissible Construction Area' constraint in your recommendations.**
         ### 1. Financial Snapshot\n- **Total Estimated Project Cost:** (Use client's budget)\n- **Down Payment (20%):**\n- **Loan Amount (80%):**\n- **Estimated EMI:** (Assume 20-year loan at 8.7% interest)\n- **EMI as % of Monthly Income:**
@@ -868,11 +1566,12 @@ def main():
         'plan_plot_area': 1200.0, 'plan_built_up': 1800.0, 'plan_floors': 2.0, 'extra_floors_rent': False, 'const_contract': 'With Material (Turnkey)',
         'const_vendors': [], 'const_green': [], 'const_timeline': 12.0, 'qual_connectivity': 'Medium', 'qual_amenities': 'Somewhat', 'risk_pollution': 'Low',
         'risk_crime': 'Low', 'fin_target_rent': 0, 'fin_target_resale': 0, 'is_joint_investment': False, 'co_owner_name': '', 'co_owner_relationship': 'Spouse',
-        'investment_share_p1': 50.0, 'investment_share_p2': 50.0, 'fsi_value': 1.5
+        'investment_share_p1': 50.0, 'investment_share_p2': 50.0, 'fsi_value': 1.5, 'project_version': 0
     }
     for key, value in defaults.items():
         if key not in st.session_state: st.session_state[key] = value
 
+    get_market_catalog()
     display_sidebar()
     st.title(f"🏠 {t('app_title')}")
     if not st.session_state.selected_project: st.info(t('welcome_message'))
@@ -0,0 +1,207 @@
+import os
+import sys
+import json
+import time
+import types
+import random
+import socket
+import asyncio
+import argparse
+import tempfile
+import resource
+import multiprocessing
+import urllib.request
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from translations import TRANSLATIONS
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+TOOLS = [
+    ("build_vs_buy", "tool_build_vs_buy_button"), ("resale_predictor", "tool_resale_predictor_button"),
+    ("payback_calculator", "tool_payback_calculator_button"), ("environmental_risk", "tool_env_risk_button"),
+    ("vendor_suggestion", "tool_vendor_suggestion_button"), ("green_savings_predictor", "tool_green_savings_predictor_button"),
+]
+FOLLOW_UP_QUESTIONS = ["What if interest is 9%?", "EMI at 9 percent?", "Should I wait a year before buying?", "How much down payment do I need?"]
+CITIES = ["Nagpur", "Pune", "Mumbai", "nagpur ", "Thane"]
+
+def install_gemini_stub(latency, jitter):
+    class StubModel:
+        def __init__(self, *args, **kwargs): pass
+        def generate_content(self, prompt, generation_config=None):
+            time.sleep(max(0.0, random.gauss(latency, jitter)))
+            return types.SimpleNamespace(text=f"### Stub Report\n| Item | Amount (₹) |\n|---|---|\n| Prompt length | {len(prompt)} |\n")
+    stub = types.ModuleType("google.generativeai")
+    stub.configure = lambda **kwargs: None; stub.GenerativeModel = StubModel
+    import google
+    sys.modules["google.generativeai"] = stub; google.generativeai = stub
+
+def serve_app(port, latency, jitter, workdir):
+    install_gemini_stub(latency, jitter); os.chdir(workdir)
+    log = os.open("server.log", os.O_WRONLY | os.O_CREAT | os.O_APPEND); os.dup2(log, 1); os.dup2(log, 2)
+    from streamlit.web import bootstrap
+    flags = {"server.port": port, "server.address": "127.0.0.1", "server.headless": True, "server.fileWatcherType": "none", "browser.gatherUsageStats": False}
+    bootstrap.load_config_options(flags); bootstrap.run(APP_PATH, False, [], flags)
+
+def start_server(args, workdir):
+    with socket.socket() as s: s.bind(("127.0.0.1", 0)); port = s.getsockname()[1]
+    server = multiprocessing.get_context("spawn").Process(target=serve_app, args=(port, args.latency, args.jitter, workdir), daemon=True)
+    server.start(); deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200: return server, port
+        except OSError: time.sleep(0.2)
+    server.terminate(); raise RuntimeError("streamlit server did not become healthy within 60s")
+
+def process_usage(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f: fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/status") as f: peak_kb = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration): return None, None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK"), peak_kb / 1024
+
+# One browser tab: a websocket to the shared server that resends widget states the way the frontend does.
+class Session:
+    def __init__(self, url, labels, timeout):
+        self.url, self.labels, self.timeout, self.timings = url, labels, timeout, {}
+        self.elements, self.values, self.auto_reruns = {}, {}, {}
+
+    async def timed(self, step, action):
+        start = time.perf_counter()
+        await asyncio.wait_for(action(), self.timeout)
+        self.timings.setdefault(step, []).append(time.perf_counter() - start)
+
+    async def rerun(self, trigger_id=None, fragment_id=""):
+        msg = BackMsg(); msg.rerun_script.page_script_hash = ""; msg.rerun_script.fragment_id = fragment_id; msg.rerun_script.is_auto_rerun = bool(fragment_id)
+        for state in self.values.values(): msg.rerun_script.widget_states.widgets.add().CopyFrom(state)
+        if trigger_id: msg.rerun_script.widget_states.widgets.add(id=trigger_id, trigger_value=True)
+        await self.ws.send(msg.SerializeToString()); await self.receive_run()
+
+    async def receive_run(self):
+        while True:
+            msg = ForwardMsg(); msg.ParseFromString(await self.ws.recv()); kind = msg.WhichOneof("type")
+            if kind == "new_session" and not msg.new_session.fragment_ids_this_run: self.elements.clear(); self.auto_reruns.clear()
+            elif kind == "auto_rerun": self.auto_reruns[msg.auto_rerun.fragment_id] = msg.auto_rerun.interval
+            elif kind == "stop_auto_rerun":
+                for fragment_id in msg.stop_auto_rerun.fragment_ids: self.auto_reruns.pop(fragment_id, None)
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element; self.elements[tuple(msg.metadata.delta_path)] = element
+                if element.WhichOneof("type") == "exception": raise RuntimeError(element.exception.message)
+            elif kind == "script_finished":
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR: raise RuntimeError("app failed to compile")
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN: return
+
+    def widgets(self, kind):
+        return [getattr(element, kind) for element in self.elements.values() if element.WhichOneof("type") == kind]
+
+    def button(self, key):
+        label = self.labels[key]
+        return next(b for b in self.widgets("button") if b.label == label or b.label.endswith(f" {label}"))
+
+    async def click(self, key):
+        await self.rerun(trigger_id=self.button(key).id)
+
+    async def fill(self, widget, value):
+        self.values[widget.id] = WidgetState(id=widget.id, string_value=value)
+        if not widget.form_id: await self.rerun()
+
+    def text_input(self, key):
+        return next(w for w in self.widgets("text_input") if w.id.endswith(f"-{key}"))
+
+    async def fill_form(self, fields, submit_key):
+        for key, value in fields.items(): await self.fill(self.text_input(key), value)
+        await self.click(submit_key)
+
+    async def wait_for_report(self):
+        await self.click("generate_strategy_button")
+        while not any(b.label.endswith(self.labels["export_report_button"]) for b in self.widgets("button")):
+            if not self.auto_reruns: raise RuntimeError("report is pending but no fragment is polling for it")
+            fragment_id, interval = next(iter(self.auto_reruns.items()))
+            await asyncio.sleep(interval); await self.rerun(fragment_id=fragment_id)
+
+    async def run(self, user_id, think_time):
+        import websockets
+        async with websockets.connect(self.url, subprotocols=["streamlit"], max_size=None, ping_interval=None) as self.ws:
+            steps = [
+                ("load", self.rerun),
+                ("create_project", lambda: self.fill_form({"new_proj_name": f"Load User {user_id}"}, "start_new_project_button")),
+                ("step1", lambda: self.fill_form({"name": f"User {user_id}", "contact": f"user{user_id}@example.com"}, "next_goal_button")),
+                ("step2", lambda: self.click("next_specifics_button")),
+                ("step3_save", lambda: self.fill_form({"loc_city": CITIES[user_id % len(CITIES)]}, "save_proceed_button")),
+                ("generate_report", self.wait_for_report),
+            ]
+            for tool, label_key in TOOLS: steps += [(f"tool:{tool}", lambda key=label_key: self.click(key)), ("back_to_analysis", lambda: self.click("back_to_analysis_button"))]
+            steps.append(("follow_up", self.ask_follow_up))
+            for step, action in steps:
+                await self.timed(step, action)
+                if think_time: await asyncio.sleep(random.expovariate(1.0 / think_time))
+        return self.timings
+
+    async def ask_follow_up(self):
+        await self.fill(self.widgets("text_area")[0], random.choice(FOLLOW_UP_QUESTIONS)); await self.click("ask_advisor_button")
+
+async def simulate_users(args, url, labels):
+    gate, active, peak, results = asyncio.Semaphore(args.concurrency), [0], [0], []
+    async def simulate_user(user_id):
+        await asyncio.sleep(args.ramp_up * user_id / max(args.users, 1))
+        async with gate:
+            active[0] += 1; peak[0] = max(peak[0], active[0]); session = Session(url, labels, args.timeout)
+            try: results.append((await session.run(user_id, args.think_time), None))
+            except Exception as err: results.append((session.timings, f"user {user_id}: {type(err).__name__}: {err}"))
+            finally: active[0] -= 1
+    await asyncio.gather(*(simulate_user(user_id) for user_id in range(args.users)))
+    return results, peak[0]
+
+def summarize(results, wall_seconds, peak_sessions, server_cpu, server_rss, client_cpu):
+    steps = {}
+    for timings, _ in results:
+        for step, samples in (timings or {}).items(): steps.setdefault(step, []).extend(samples)
+    rows = []
+    for step, samples in steps.items():
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1000
+        rows.append({"step": step, "count": len(samples), "p50_ms": round(p50, 1), "p95_ms": round(p95, 1), "p99_ms": round(p99, 1), "max_ms": round(max(samples) * 1000, 1)})
+    completed = sum(1 for _, error in results if error is None)
+    return {
+        "steps": rows, "completed_sessions": completed, "errors": [error for _, error in results if error], "wall_seconds": round(wall_seconds, 2),
+        "sessions_per_second": round(completed / wall_seconds, 2) if wall_seconds else 0.0, "peak_concurrent_sessions_per_instance": peak_sessions,
+        "instance_cpu_seconds": None if server_cpu is None else round(server_cpu, 2), "instance_peak_rss_mb": None if server_rss is None else round(server_rss, 1),
+        "client_cpu_seconds": round(client_cpu, 2),
+    }
+
+def print_report(summary):
+    print(f"{'step':<32}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for row in summary["steps"]: print(f"{row['step']:<32}{row['count']:>7}{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}")
+    print(f"\nper-instance concurrency: {summary['peak_concurrent_sessions_per_instance']} simultaneous sessions on one streamlit server")
+    print(f"sessions completed: {summary['completed_sessions']} in {summary['wall_seconds']}s ({summary['sessions_per_second']}/s)")
+    print(f"instance cpu: {summary['instance_cpu_seconds']}s   instance peak rss: {summary['instance_peak_rss_mb']} MB   load generator cpu: {summary['client_cpu_seconds']}s   errors: {len(summary['errors'])}")
+    for error in summary["errors"][:10]: print(f"  {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive one `streamlit run` instance of the AI Real Estate Advisor with many concurrent headless browser sessions and a stubbed Gemini model.")
+    parser.add_argument("--users", type=int, default=20, help="total simulated users")
+    parser.add_argument("--concurrency", type=int, default=4, help="simultaneous websocket sessions against the single server instance")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds over which user start times are spread")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean pause between a user's steps in seconds (exponentially distributed)")
+    parser.add_argument("--latency", type=float, default=1.0, help="mean stub Gemini latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.2, help="std. deviation of stub latency in seconds")
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-step timeout in seconds")
+    parser.add_argument("--json", help="also write the summary to this file")
+    args = parser.parse_args()
+    if args.json: args.json = os.path.abspath(args.json)
+    workdir = tempfile.mkdtemp(prefix="advisor-loadtest-"); os.chdir(workdir)
+    server, port = start_server(args, workdir)
+    try:
+        start = time.perf_counter()
+        results, peak_sessions = asyncio.run(simulate_users(args, f"ws://127.0.0.1:{port}/_stcore/stream", TRANSLATIONS['en']))
+        wall_seconds = time.perf_counter() - start; server_cpu, server_rss = process_usage(server.pid)
+    finally: server.terminate(); server.join(10)
+    client = resource.getrusage(resource.RUSAGE_SELF)
+    summary = summarize(results, wall_seconds, peak_sessions, server_cpu, server_rss, client.ru_utime + client.ru_stime)
+    print(f"workdir: {workdir} (server output in server.log)"); print_report(summary)
+    if args.json:
+        with open(args.json, "w") as f: json.dump(summary, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import io
+import os
+
+try:
+    from xhtml2pdf import pisa
+except ImportError:
+    pisa = None
+
+# Kept out of app.py so ProcessPoolExecutor workers can import it without running the Streamlit script.
+def html_to_pdf(html_doc, allowed_files=()):
+    allowed = {os.path.realpath(path) for path in allowed_files}
+    def link_callback(uri, rel):
+        path = os.path.realpath(uri[len("file://"):] if uri.startswith("file://") else uri)
+        return path if path in allowed else ""
+    buffer = io.BytesIO(); result = pisa.CreatePDF(html_doc, dest=buffer, encoding="utf-8", link_callback=link_callback)
+    if result.err: raise RuntimeError(f"PDF rendering failed with {result.err} error(s)")
+    return buffer.getvalue()
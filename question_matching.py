@@ -0,0 +1,39 @@
+import re
+
+QUESTION_SYNONYMS = {
+    "percent": "%", "percentage": "%", "pct": "%", "प्रतिशत": "%", "टक्के": "%", "टक्का": "%",
+    "interest rate": "interest", "rate of interest": "interest", "ब्याज": "interest", "व्याज": "interest", "emi's": "emi", "ईएमआई": "emi",
+}
+QUESTION_WORD_FOLDS = {"emi": "interest", "emis": "interest", "home": "house", "flat": "house", "property": "house", "purchase": "buy", "buying": "buy", "खरीद": "buy", "खरेदी": "buy"}
+QUESTION_STOPWORDS = {
+    "a", "an", "the", "what", "if", "is", "are", "was", "be", "at", "of", "for", "to", "in", "on", "by", "my", "i", "me", "we", "our", "you", "it",
+    "should", "would", "will", "can", "could", "do", "does", "how", "much", "many", "and", "or", "with", "then", "so", "about", "please", "tell",
+    "अगर", "तो", "हो", "है", "क्या", "मेरा", "मेरी", "मैं", "का", "की", "के", "पर", "जर", "तर", "आहे", "काय", "माझा", "माझी", "मी", "चा", "ची", "चे",
+}
+QUESTION_GUARD_WORDS = {
+    "increase": "up", "increases": "up", "increased": "up", "raise": "up", "raised": "up", "rise": "up", "rises": "up", "higher": "up", "more": "up", "up": "up", "hike": "up", "ज्यादा": "up", "जास्त": "up",
+    "decrease": "down", "decreases": "down", "decreased": "down", "reduce": "down", "reduced": "down", "lower": "down", "less": "down", "fall": "down", "falls": "down", "drop": "down", "down": "down", "cut": "down", "कम": "down",
+    "not": "not", "no": "not", "never": "not", "without": "not", "नहीं": "not", "मत": "not", "नाही": "not", "नको": "not",
+    "year": "year", "years": "year", "yr": "year", "yrs": "year", "annual": "year", "yearly": "year", "साल": "year", "वर्ष": "year",
+    "month": "month", "months": "month", "monthly": "month", "महीने": "month", "महिना": "month", "महिने": "month",
+}
+
+def normalize_question(question):
+    text = " ".join(question.lower().split())
+    for phrase in sorted(QUESTION_SYNONYMS, key=len, reverse=True): text = text.replace(phrase, QUESTION_SYNONYMS[phrase])
+    return re.sub(r"(\d)\s*%", r"\1 %", text)
+
+def question_tokens(question):
+    text = re.sub(r"n't\b", " not", normalize_question(question).replace("’", "'"))
+    return re.findall(r"\d+(?:\.\d+)?|%|[^\s\d%?!.,;:()\"'/-]+", text)
+
+def question_signature(question):
+    signature = set()
+    for token in question_tokens(question):
+        if token in QUESTION_STOPWORDS: continue
+        if token[0].isdigit(): signature.add(float(token))
+        else: signature.add(QUESTION_GUARD_WORDS.get(token) or QUESTION_WORD_FOLDS.get(token, token))
+    return frozenset(signature)
+
+def questions_match(first, second):
+    return question_signature(first) == question_signature(second)
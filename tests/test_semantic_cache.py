@@ -0,0 +1,36 @@
+import pytest
+
+from question_matching import question_signature, questions_match
+
+EQUIVALENT = [
+    ("What if interest is 9%?", "EMI at 9 percent?"),
+    ("What if interest is 9%?", "अगर ब्याज 9% हो तो?"),
+    ("What if the interest rate is 9 percent?", "interest at 9%"),
+]
+
+DIFFERENT = [
+    ("What if interest is 9%?", "What if interest is 10%?"),
+    ("What if I increase my down payment by 10 lakh?", "What if I decrease my down payment by 10 lakh?"),
+    ("Should I buy now?", "Should I not buy now?"),
+    ("Should I buy now?", "Shouldn't I buy now?"),
+    ("Should I wait a year before buying?", "Should I wait a month before buying?"),
+    ("What if prices rise?", "What if prices fall?"),
+    ("Should I take a 50 lakh loan from SBI versus private banks over 20 years?", "Should I take a 50 lakh loan from HDFC versus private banks over 20 years?"),
+    ("Is it better to buy a 2 BHK resale flat in Nagpur?", "Is it better to buy a 2 BHK resale flat in Pune?"),
+    ("Is it better to buy a 2 BHK resale flat in Nagpur?", "Is it better to buy a 3 BHK resale flat in Nagpur?"),
+    ("Which is the best floating rate home loan for me?", "Which is the best fixed rate home loan for me?"),
+]
+
+@pytest.mark.parametrize("first, second", EQUIVALENT)
+def test_equivalent_questions_match(first, second):
+    assert questions_match(first, second)
+
+@pytest.mark.parametrize("first, second", DIFFERENT)
+def test_questions_differing_in_meaning_do_not_match(first, second):
+    assert not questions_match(first, second)
+
+def test_signature_ignores_word_order_and_stopwords():
+    assert question_signature("Should I buy a flat now?") == question_signature("now buy flat")
+
+def test_signature_treats_equal_numbers_alike():
+    assert question_signature("interest at 9%") == question_signature("interest at 9.0%")
@@ -0,0 +1,94 @@
+TRANSLATIONS = {
+    'en': {
+        "language_name": "English", "app_title": "AI Real Estate Advisor", "project_manager_title": "Project Manager",
+        "active_project_caption": "Active Project", "switch_project_button": "🔄 Switch Project", "danger_zone_header": "🚨 Danger Zone",
+        "delete_confirm_checkbox": "Confirm deletion", "delete_project_button": "❌ Delete Project Permanently", "project_deleted_success": "Project '{project_name}' has been deleted.",
+        "project_file_not_found_warning": "Project file for '{project_name}' not found.", "delete_project_error": "Error deleting project: {e}",
+        "create_new_project_header": "➕ Create New Project", "new_project_name_label": "Enter a Unique Project Name", "start_new_project_button": "Start New Project",
+        "project_name_exists_error": "Project name already exists.", "enter_project_name_warning": "Please enter a project name.",
+        "load_existing_project_header": "📂 Load Existing Project", "select_project_placeholder": "Choose a project...", "load_project_button": "Load Project",
+        "search_projects_label": "Search projects", "search_projects_placeholder": "Type the start of a project name...", "filter_projects_expander": "Filters",
+        "filter_budget_min_label": "Min. Budget (₹)", "filter_budget_max_label": "Max. Budget (₹)", "search_page_label": "Page (of {pages})",
+        "search_results_caption": "{total} matching projects", "no_matching_projects_info": "No projects match your search.",
+        "batch_export_button": "📦 Export {count} matching reports", "download_batch_button": "⬇️ Download reports (.zip)", "batch_export_empty_warning": "None of the matching projects has a generated report yet.", "batch_export_running_info": "Exporting {count} reports in the background...",
+        "report_tables_header": "Supporting Analysis",
+        "portfolio_overview_header": "Portfolio Overview", "portfolio_projects_label": "Projects", "portfolio_avg_budget_label": "Avg. Budget (₹)", "project_views_refresh_warning": "Project '{project_name}' was updated, but search and portfolio views could not be refreshed: {err}", "report_export_error": "⚠️ Could not export the report: {err}",
+        "project_loaded_success": "Project '{project_name}' loaded successfully!", "load_project_error": "Failed to load project '{project_name}': {e}",
+        "disclaimer_info": "AI-generated advice. Always consult a professional before making financial decisions.",
+        "welcome_message": "👋 **Welcome!** To begin, please create a new project or load an existing one from the sidebar.", "current_project_header": "Current Project: **{project_name}**",
+        "step1_header": "STEP 1: Your Personal Details", "full_name_label": "Full Name", "dob_label": "Date of Birth", "contact_label": "Email or Phone",
+        "income_label": "Annual Household Income (₹)", "next_goal_button": "Next: Define Your Goal", "fill_all_details_error": "Please fill in all details.",
+        "step2_header": "STEP 2: What is Your Primary Goal?", "select_goal_label": "Select your goal", "buy_flat": "Buy a Flat", "build_house": "Build a House",
+        "buy_plot": "Buy a Plot", "mixed_investment": "Mixed / Investment", "next_specifics_button": "Next: Add Specifics",
+        "step3_header": "STEP 3: Specifics for '{intent_type}'", "location_budget_header": "Location & Budget", "target_city_label": "Target City",
+        "localities_label": "Preferred Localities (comma-separated)", "pincode_label": "Pin Code", "budget_label": "Total Budget (₹)",
+        "need_loan_checkbox": "Need a loan?", "subsidy_checkbox": "Interested in subsidy schemes?", "main_purpose_label": "Main purpose?",
+        "self_use": "Self Use", "rental_income": "Rental Income", "resale_investment": "Resale / Investment", "mixed_components_label": "Select all that apply:",
+        "flat_details_header": "Flat Details", "flat_size_label": "Flat Size", "plot_construction_potential_header": "Plot & Construction Potential",
+        "plot_area_label": "Plot Area (sq. ft)", "construction_details_header": "Construction Details", "built_up_area_label": "Target Built-up Area (sq. ft)",
+        "floors_label": "Number of Floors Planned", "extra_floors_rent_checkbox": "Plan extra floors for rent?", "contract_type_label": "Contract Type",
+        "vendors_label": "Specific Vendors Needed?", "green_features_label": "Desired Green Features", "timeline_label": "Estimated Build Timeline (Months)",
+        "preferences_concerns_header": "Preferences & Concerns", "connectivity_label": "Connectivity Importance", "amenities_label": "Proximity to Schools/Hospitals",
+        "pollution_label": "Pollution Concern Level", "crime_label": "Crime Concern Level", "investment_goals_header": "Investment Goals",
+        "target_rent_label": "Target Monthly Rent Income (₹)", "target_resale_label": "Target Resale Price (₹)", "save_proceed_button": "Save Project & Proceed to Analysis",
+        "step4_header": "STEP 4: Review and Generate AI Strategy", "project_saved_success": "Your project is saved. Review the details below and generate your personalized financial plan.",
+        "view_details_expander": "View/Hide Your Saved Project Details", "market_snapshot_header": "📈 Market Snapshot: {city}", "generate_strategy_button": "🧠 Generate Financial Strategy",
+        "edit_details_button": "✏️ Edit Specifics", "analyzing_spinner": "🤖 Analyzing your project and crafting a detailed financial plan...",
+        "strategy_header": "💡 Your Personalized Financial Strategy", "follow_up_expander": "💬 Ask a Follow-up Question",
+        "follow_up_placeholder": "e.g., What happens if the interest rate increases by 0.5%?", "ask_advisor_button": "✉️ Ask Advisor",
+        "enter_question_warning": "Please enter a question.", "thinking_spinner": "🤔 Thinking...", "mixed_investment_header": "Co-Ownership & Investment Details",
+        "is_joint_investment_checkbox": "Is this a joint investment with a co-owner?", "co_owner_name_label": "Co-owner's Full Name",
+        "co_owner_relationship_label": "Relationship to Co-owner", "investment_share_p1_label": "Your Share (%)", "investment_share_p2_label": "Co-owner's Share (%)",
+        "relationship_spouse": "Spouse", "relationship_parent": "Parent/Child", "relationship_sibling": "Sibling", "relationship_business": "Business Partner", "relationship_other": "Other",
+        "fsi_label": "Floor Space Index (FSI)", "fsi_help": "The ratio of a building's total floor area to the size of the piece of land upon which it is built. Check local regulations for the correct value.",
+        "max_construction_area_label": "Max. Permissible Construction Area", "export_report_button": "📄 Export Report", "download_pdf_button": "⬇️ Download PDF", "download_html_button": "⬇️ Download HTML",
+        "advanced_tools_header": "🛠️ Advanced Analysis Tools", "back_to_analysis_button": "⬅️ Back to Main Analysis", "back_button_text": "⬅️ Back",
+        "api_error_message": "⚠️ An error occurred with the AI service: {err}",
+        "report_queued_info": "⏳ Your report is being generated in the background. You can keep working; it will appear here when ready.", "report_job_error": "⚠️ Report generation failed: {err}",
+        "follow_up_cache_hit_caption": "♻️ Answered from an equivalent earlier question.", "follow_up_cache_stats_caption": "Follow-up cache: {hits} of {lookups} questions reused ({rate:.0%}).",
+        "project_version_conflict_error": "Project '{project_name}' was changed by someone else (saved version {current_version}, yours {expected_version}). Reload the project and re-apply your edits.",
+        "analysis_projections_header": "Analysis & Projections", "cost_construction_header": "Cost & Construction", "financial_green_header": "Financial & Green",
+        "tool_build_vs_buy_button": "Build vs. Buy", "tool_build_vs_buy_title": "Build vs. Buy: Unit Economics", "tool_build_vs_buy_info": "This tool compares the total project cost of building a multi-unit property versus the cost of buying a single ready-made flat, breaking it down to a per-unit cost.", "build_cost_header": "Total Project Cost (to Build)", "buy_cost_header": "Cost to Buy (Single Flat)", "land_cost": "Land Cost", "construction_cost": "Total Construction Cost", "other_costs": "Other Costs (10%)", "total_build_cost": "Total Project Cost", "property_price": "Ready-Made Flat Price", "breakeven_analysis_header": "Per-Unit Breakeven Analysis", "num_flats_to_build_label": "Number of Flats to Build", "cost_per_flat_build_label": "Cost Per Flat (If You Build)", "price_ready_flat_label": "Price of Ready-Made Flat", "build_vs_buy_conclusion": "Your total project cost of **₹{total_build_cost:,.0f}** is high due to land value. However, by building **{num_flats} units**, your effective cost per flat is **₹{cost_per_flat:,.0f}**, which is **{comparison}** than buying a single ready-made flat for **₹{buy_price:,.0f}**.",
+        "tool_locality_compare_button": "Hyper-Local Prices", "tool_locality_compare_title": "Hyper-Local Price Analyzer", "tool_locality_compare_info": "This tool shows how property prices can vary within the same locality based on proximity to the main road.", "locality_price_table_header": "Price Variation in {locality}",
+        "tool_sqft_breakdown_button": "Detailed Costs", "tool_sqft_breakdown_title": "Detailed Construction Cost Breakdown", "tool_sqft_breakdown_info": "This provides a detailed breakdown of construction costs, showing each item's price based on your budget and its percentage of the total.", "house_construction_tab": "House Construction Costs", "flat_interiors_tab": "Flat Finishing Costs", "cost_item_label": "Item", "cost_sqft_label": "Cost per sq.ft. (₹)", "cost_as_percent_label": "% of Total", "cost_price_label": "Price (₹)",
+        "tool_contract_diff_button": "Material Prices", "tool_contract_diff_title": "Material Price Analyzer", "tool_contract_diff_info": "This tool shows estimated prices for key construction materials across different commercial zones in your city.", "material_prices_header": "Estimated Material Prices in {city}",
+        "tool_resale_predictor_button": "Resale Predictor", "tool_resale_predictor_title": "Resale Value Predictor", "tool_resale_predictor_info": "This tool projects the future resale value of your property based on a simulated annual growth rate.", "resale_projection_header": "{years}-Year Resale Projection for a {size} sq.ft. Property", "current_value_label": "Current Estimated Value", "projected_value_label": "Projected Value", "annual_growth_rate_label": "Simulated Annual Growth Rate", "property_size_label": "Property Size (sq.ft)",
+        "tool_rent_forecaster_button": "Rent Forecaster", "tool_rent_forecaster_title": "Hyper-Local Rental Income Forecaster", "tool_rent_forecaster_info": "Estimate potential monthly rent based on both rental type (Residential, Retail, Office) and the property's specific location within the neighborhood.", "forecast_monthly_rent_label": "Forecasted Monthly Rent (₹)", "location_label": "Location",
+        "tool_payback_calculator_button": "Payback Calculator", "tool_payback_calculator_title": "Hyper-Local Investment Payback Calculator", "tool_payback_calculator_info": "Calculates the payback period (in years) based on rental type and location, factoring in different maintenance & expense ratios for each.", "payback_period_label": "Payback Period (Years)",
+        "rent_type_residential": "Residential", "rent_type_commercial_retail": "Commercial (Retail)", "rent_type_commercial_office": "Commercial (Office)",
+        "green_eco_costing_header": "♻️ Green + Eco Costing",
+        "tool_green_cost_estimator_button": "Green Cost Estimator", "tool_green_cost_estimator_title": "Green Feature Cost Estimator", "tool_green_cost_estimator_info": "Estimate the initial installation cost for popular eco-friendly features like solar panels, rainwater harvesting, and insulation.",
+        "green_feature_label": "Green Feature", "estimated_cost_label": "Estimated Cost (₹)", "notes_label": "Notes / Assumptions",
+        "solar_panels_label": "Solar Panels", "rainwater_harvesting_label": "Rainwater Harvesting", "heat_insulation_label": "Heat Insulation (Roof)",
+        "solar_note": "Based on a 5kW system for a standard house.", "rainwater_note": "For a 10,000-liter underground tank.", "insulation_note": "Based on roof area (approx. 60% of built-up area).",
+        "tool_green_savings_predictor_button": "Green Savings Predictor", "tool_green_savings_predictor_title": "Eco-Savings & Payback Predictor", "tool_green_savings_predictor_info": "This tool forecasts your long-term financial savings on utility bills (electricity, water) from green investments and calculates the simple payback period.",
+        "annual_savings_label": "Est. Annual Savings (₹)", "payback_period_years_label": "Payback Period (Years)",
+        "location_intelligence_header": "📍 Location & Market Intelligence",
+        "tool_location_quality_button": "Location Quality Score", "tool_location_quality_title": "Location Quality Score Analyzer", "tool_location_quality_info": "Calculates a quality score for your target location based on your preferences for connectivity, amenities, and your concerns about pollution and crime.",
+        "your_location_score_label": "Your Location's Quality Score", "score_breakdown_header": "Score Breakdown", "factor_label": "Factor", "your_preference_label": "Your Preference", "score_impact_label": "Score Impact",
+        "tool_compare_localities_button": "Compare Nearby Options", "tool_compare_localities_title": "Comparative Locality Analysis", "tool_compare_localities_info": "Discover alternative localities in the same city that might offer better value or a better location score for your budget.",
+        "your_target_locality_label": "Your Target Locality", "for_your_budget_label": "For your budget of", "you_can_get_label": "you can get approx.", "sq_ft_label": "sq. ft.",
+        "alternative_localities_header": "Alternative Localities in {city}", "locality_label": "Locality", "avg_price_psf_label": "Avg. Price (psf)", "location_score_label": "Location Score", "property_size_for_budget_label": "Area for your Budget", "vibe_label": "Vibe / Character",
+        "tool_env_risk_button": "Environmental Risk", "tool_env_risk_title": "Flood & Eco-Zone Risk Analysis", "tool_env_risk_info": "Assesses potential flood and ecological sensitivity risks for your chosen locality. *Note: This is a simulation based on general data and not a legal certification.*",
+        "risk_assessment_for_label": "Risk Assessment For:", "flood_risk_label": "Flood Zone Risk", "eco_risk_label": "Ecological Sensitivity",
+        "risk_level_low": "Low", "risk_level_medium": "Medium", "risk_level_high": "High",
+        "risk_advice_low": "Standard precautions recommended.", "risk_advice_medium": "Further due diligence recommended. Check local municipal records and consider professional assessment.", "risk_advice_high": "High risk indicated. Essential to consult local authorities and perform a detailed environmental impact assessment before proceeding.",
+        "tool_vendor_suggestion_button": "Find Vendors", "tool_vendor_suggestion_title": "Top-Rated Vendor Suggestions", "tool_vendor_suggestion_info": "Find simulated top-rated builders and vendors in your city for various project needs. *Ratings and reviews are for demonstration purposes.*",
+        "vendor_type_label": "Select Vendor Type", "vendor_name_label": "Vendor Name", "vendor_specialty_label": "Specialty", "vendor_rating_label": "Rating", "vendor_review_label": "Summary",
+        "vendor_reviews_caption": "{count} reviews",
+        "flood_depth_label": "Modelled Flood Depth", "elevation_label": "Elevation", "risk_source_gis_caption": "Based on local flood-zone, protected-area and elevation layers.",
+        "risk_source_heuristic_caption": "No mapped location for this pincode/locality; this is an indicative estimate only.", "vendor_top_matches_header": "Top matches for your selected services", "any_specialty_option": "All specialties",
+        "tool_loan_guide_button": "Loan & Subsidy Guide", "tool_loan_guide_title": "Loan & Subsidy Eligibility Guide", "tool_loan_guide_info": "Get information on home loans, potential government subsidies like PMAY, and tax benefits.",
+        "loan_tips_header": "Home Loan Tips", "pmay_guide_header": "PMAY Subsidy Guide", "tax_benefits_header": "Tax Saving Tips", "pmay_eligibility_header": "Your PMAY Eligibility (Simulation)",
+    },
+    'hi': {
+        "language_name": "Hindi (हिन्दी)", "app_title": "एआई रियल एस्टेट सलाहकार",
+    },
+    'mr': {
+        "language_name": "Marathi (मराठी)", "app_title": "एआय रिअल इस्टेट सल्लागार",
+    }
+}
+for lang in ['hi', 'mr']:
+    for key, value in TRANSLATIONS['en'].items():
+        if key not in TRANSLATIONS[lang]:
+            TRANSLATIONS[lang][key] = value